@@ -1,120 +1,641 @@
-import os
+import re
 import json
+import html
+import asyncio
 import logging
-from scripts.aiml import api
+import time
+import random
+import threading
+import hashlib
+import functools
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from config import Config
+from scripts.aiml import api, async_api
+from utils.llm_cache import LLMCache
+from utils.rate_limiter import AsyncRateLimiter
+
+# Retries are handled below with backoff, so turn off the client's own
+_api = api.with_options(max_retries=0)
+_async_api = async_api.with_options(max_retries=0)
 
 logger = logging.getLogger(__name__)
 
+MODEL = "mistralai/Mistral-7B-Instruct-v0.2"
+DEFAULT_SYSTEM_PROMPT = "You are a job application assistant. Be concise."
+
+# Structured-output instructions, sent as the system prompt so they are never truncated
+JOB_DETAILS_SYSTEM_PROMPT = (
+    DEFAULT_SYSTEM_PROMPT + ' Reply only with a JSON object: '
+    '{"description": string, "requirements": string}'
+)
+ANALYSIS_SYSTEM_PROMPT = (
+    DEFAULT_SYSTEM_PROMPT + ' Reply only with a JSON object: '
+    '{"apply": boolean, "reason": string, "matching_skills": [string], "concerns": [string]}'
+)
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Form and screening prompts; the resume parts are bound once per assistant
+FIELD_PROMPT = "Resume:\n{summary}\nForm field: {label} ({type}).{options} Reply with the value only, or SKIP if unknown."
+FIELD_OPTIONS_PROMPT = " Options: {options}. Reply with one option exactly."
+CHOICE_QUESTION_PROMPT = "Resume:\n{summary}\nQuestion: {question} Options: {options}. Reply with one option exactly, or SKIP."
+OPEN_QUESTION_PROMPT = "Resume: {resume}\nQuestion: {question} Reply briefly, or SKIP."
+
+# Retries for transient API failures before giving up, and the backoff cap in seconds
+MAX_API_RETRIES = 3
+MAX_RETRY_DELAY = 10
+
+# Connection errors and timeouts, 5xx and 429 are worth retrying; other 4xx are not
+TRANSIENT_API_ERRORS = (APIConnectionError, InternalServerError, RateLimitError)
+
+# Bump when prompt templates change so cached responses are not reused
+PROMPT_VERSION = 1
+
+# Maximum memoized results kept per assistant instance
+MEMO_SIZE = 4096
+
+# Rough characters-per-token average for English text, used for prompt budgets
+CHARS_PER_TOKEN = 4
+
+# Job posting text sent for detail extraction: ~1600 characters, enough for the
+# role summary and most requirement lists while keeping the prompt cheap
+MAX_JOB_TEXT_TOKENS = 400
+# Prompt length cap for detail extraction, so the default 200-character cap does not cut the text again
+JOB_DETAILS_MAX_LENGTH = MAX_JOB_TEXT_TOKENS * CHARS_PER_TOKEN + 100
+
+# Skill overlap above which analyze_job approves without the LLM; anything lower goes to the LLM,
+# since a missed keyword is no reason to reject
+MAX_SKILL_SCORE = 0.5
+
+# Reasons for verdicts that did not come from the LLM, which callers should not persist
+SKILL_MATCH_REASON = "Strong skill overlap"
+ANALYSIS_FAILED_REASON = "Failed to analyze job"
+
+# Matches "A<n>: <answer>" lines in a batched form-answer response
+_ANSWER_LINE_RE = re.compile(r'^\s*A(\d+):\s*(.*)$', re.M)
+
+# First {...} block in a reply that wrapped its JSON in prose or code fences
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.S)
+
+# HTML stripping patterns, compiled once
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Word tokens that keep skill names like 'node.js', 'c++' and 'c#' intact
+_SKILL_TOKEN_RE = re.compile(r'[\w+#]+(?:\.[\w+#]+)*')
+
+def html_to_text(html_content):
+    """Strip tags (and script/style bodies) from HTML, collapsing whitespace"""
+    text = _SCRIPT_STYLE_RE.sub(' ', html_content)
+    text = _TAG_RE.sub(' ', text)
+    return ' '.join(html.unescape(text).split())
+
+def truncate_to_tokens(text, max_tokens):
+    """Truncate text to an approximate token budget without splitting words"""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit + 1)
+    return text[:cut if cut > 0 else limit]
+
+def parse_json_response(response):
+    """Parse a JSON object from a model reply, or return None"""
+    if not response:
+        return None
+    try:
+        data = json.loads(response)
+    except ValueError:
+        match = _JSON_OBJECT_RE.search(response)
+        if not match:
+            return None
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            return None
+    return data if isinstance(data, dict) else None
+
+@functools.lru_cache(maxsize=1024)
+def join_options(options):
+    """Comma-join a tuple of options, cached since the same option lists recur on every form"""
+    return ', '.join(options)
+
+def content_hash(text):
+    """Short stable digest of a page or text fragment for cache keys"""
+    return hashlib.blake2b((text or '').encode('utf-8'), digest_size=16).hexdigest()
+
+def retry_delay(error, attempt):
+    """Seconds to wait before retrying a failed API request"""
+    retry_after = None
+    if isinstance(error, RateLimitError) and error.response is not None:
+        retry_after = error.response.headers.get('retry-after')
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = min(2 ** attempt, MAX_RETRY_DELAY)
+    return delay + random.uniform(0, 1)  # Jitter so concurrent callers don't retry together
+
+@functools.lru_cache(maxsize=1)
+def load_resume(path='data/resume_info.json'):
+    """Load resume data from JSON file, parsed once per process"""
+    with open(path, 'rb') as f:
+        return json.load(f)
+
 class AIJobAssistant:
-    def __init__(self):
+    def __init__(self, max_concurrency=5, requests_per_minute=None):
         """Initialize the AI assistant"""
         self.resume = self._load_resume()
+        self.max_concurrency = max_concurrency
+        self._cache = LLMCache()
+        self._memo = {}
+        self._limiter = AsyncRateLimiter(requests_per_minute or Config.AI_REQUESTS_PER_MINUTE)
+        
+        # Precompute resume fragments once instead of on every prompt
+        skills = self.resume.get('skills', {})
+        langs = skills.get('programming_languages', [])
+        frameworks = skills.get('frameworks', [])
+        self._key_skills = ', '.join(langs[:3] + frameworks[:2])
+        self._skills_set = {skill.lower() for names in skills.values() for skill in names}
+        
+        exp = self.resume.get('experience', [])[0] if self.resume.get('experience') else {}
+        self._key_experience = f"{exp.get('title')} at {exp.get('company')}" if exp else ""
         
+        self._resume_json = json.dumps(self.resume, separators=(',', ':'))
+        self._resume_summary = self._build_summary()
+        self._field_prompt = functools.partial(FIELD_PROMPT.format, summary=self._resume_summary)
+        self._choice_question_prompt = functools.partial(CHOICE_QUESTION_PROMPT.format, summary=self._resume_summary)
+        self._open_question_prompt = functools.partial(OPEN_QUESTION_PROMPT.format, resume=self._resume_json)
+        self._field_map = self._build_field_map()
+        # A key must open the label as whole words, so "Company name", "Ethnicity"
+        # or "Emergency contact phone" never pick up the candidate's own details
+        self._field_patterns = tuple(
+            (re.compile(r'^' + re.escape(key) + r'\b'), key) for key in self._field_map
+        )
+
+    @property
+    def cache_stats(self):
+        """Hit/miss counters for the LLM response cache"""
+        return self._cache.stats()
+
     def _load_resume(self):
         """Load resume data from JSON file"""
         try:
-            with open('data/resume_info.json', 'r') as f:
-                return json.load(f)
+            return load_resume()
         except Exception as e:
             logger.error(f"Error loading resume: {str(e)}")
             return {}
+
+    def _build_summary(self):
+        """Build a short plain-text resume summary for prompts"""
+        info = self.resume.get('personal_info', {})
+        prefs = self.resume.get('preferences', {})
+        edu = self.resume.get('education', [])[0] if self.resume.get('education') else {}
         
-    def _make_api_request(self, prompt, system_prompt="You are a job application assistant. Be concise."):
+        lines = [
+            f"Name: {info.get('name', '')}",
+            f"Current title: {prefs.get('current_title', '')}",
+            f"Years of experience: {prefs.get('years_of_experience', '')}",
+            f"Skills: {self._key_skills}",
+            f"Recent role: {self._key_experience}",
+            f"Education: {edu.get('degree', '')}, {edu.get('institution', '')}" if edu else "Education: ",
+            f"Location: {info.get('location', '')}",
+            f"Work authorization: {info.get('work_authorization', '')}",
+            f"Willing to relocate: {prefs.get('willing_to_relocate', '')}"
+        ]
+        return '\n'.join(lines)
+
+    def _build_field_map(self):
+        """Map common form field labels straight to resume values"""
+        info = self.resume.get('personal_info', {})
+        prefs = self.resume.get('preferences', {})
+        name_parts = (info.get('name') or '').split()
+        years = prefs.get('years_of_experience')
+        
+        field_map = {
+            'first name': name_parts[0] if name_parts else None,
+            'last name': name_parts[-1] if len(name_parts) > 1 else None,
+            'full name': info.get('name'),
+            'email': info.get('email'),
+            'phone': info.get('phone'),
+            'mobile': info.get('phone'),
+            'linkedin': info.get('linkedin'),
+            'github': info.get('github'),
+            'portfolio': info.get('portfolio'),
+            'website': info.get('portfolio'),
+            'location': info.get('location'),
+            'work authorization': info.get('work_authorization'),
+            'years of experience': str(years) if years is not None else None
+        }
+        return {key: value for key, value in field_map.items() if value}
+
+    def _build_request(self, prompt, system_prompt, max_length, max_tokens, temperature, response_format=None):
+        """Build chat completion arguments shared by sync and async requests"""
+        # Truncate prompt if too long
+        if len(prompt) > max_length:
+            prompt = prompt[:max_length - 3] + "..."
+
+        kwargs = {
+            'model': MODEL,
+            'messages': [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+        }
+        if max_tokens:
+            kwargs['max_tokens'] = max_tokens
+        if temperature is not None:
+            kwargs['temperature'] = temperature
+        if response_format:
+            kwargs['response_format'] = response_format
+        return kwargs
+
+    def _cache_key(self, request):
+        """Cache key for a request, or None if the response is not deterministic"""
+        if request.get('temperature') != 0:
+            return None
+        return LLMCache.make_key({**request, 'prompt_version': PROMPT_VERSION})
+
+    def _memoized(self, key, compute):
+        """Return a remembered result for key, computing and storing it on a miss"""
+        if key in self._memo:
+            return self._memo[key]
+        result = compute()
+        # Failed lookups (None or (None, None)) are not remembered so they can be retried
+        if result is not None and result != (None, None):
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[key] = result
+        return result
+
+    def _make_api_request(self, prompt, system_prompt=DEFAULT_SYSTEM_PROMPT,
+                          max_length=200, max_tokens=None, temperature=0, response_format=None):
         """Make a request to AIML API"""
         try:
-            # Truncate prompt if too long
-            if len(prompt) > 200:
-                prompt = prompt[:197] + "..."
-                
-            completion = api.chat.completions.create(
-                model="mistralai/Mistral-7B-Instruct-v0.2",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return completion.choices[0].message.content
+            request = self._build_request(prompt, system_prompt, max_length, max_tokens,
+                                          temperature, response_format)
+            key = self._cache_key(request)
+            if key:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+            completion = self._create_completion(request)
+            content = completion.choices[0].message.content
+            if key and content:
+                self._cache.set(key, content)
+            return content
         except Exception as e:
             logger.error(f"API request failed: {str(e)}")
             return None
 
+    async def _amake_api_request(self, prompt, system_prompt=DEFAULT_SYSTEM_PROMPT,
+                                 max_length=200, max_tokens=None, temperature=0, response_format=None):
+        """Make a non-blocking request to AIML API"""
+        try:
+            request = self._build_request(prompt, system_prompt, max_length, max_tokens,
+                                          temperature, response_format)
+            key = self._cache_key(request)
+            if key:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+            completion = await self._acreate_completion(request)
+            content = completion.choices[0].message.content
+            if key and content:
+                self._cache.set(key, content)
+            return content
+        except Exception as e:
+            logger.error(f"Async API request failed: {str(e)}")
+            return None
+
+    def _create_completion(self, request):
+        """Send a completion request, retrying transient failures with backoff"""
+        for attempt in range(MAX_API_RETRIES + 1):
+            try:
+                return _api.chat.completions.create(**request)
+            except TRANSIENT_API_ERRORS as e:
+                if attempt == MAX_API_RETRIES:
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.warning(f"{type(e).__name__} from API, retrying in {delay:.1f} seconds")
+            time.sleep(delay)
+
+    async def _acreate_completion(self, request):
+        """Send a rate-limited completion request, retrying transient failures with backoff"""
+        for attempt in range(MAX_API_RETRIES + 1):
+            async with self._limiter:
+                try:
+                    return await _async_api.chat.completions.create(**request)
+                except TRANSIENT_API_ERRORS as e:
+                    if attempt == MAX_API_RETRIES:
+                        raise
+                    delay = retry_delay(e, attempt)
+                    logger.warning(f"{type(e).__name__} from API, retrying in {delay:.1f} seconds")
+            await asyncio.sleep(delay)
+
+    def _job_details_prompt(self, html_content):
+        """Build the prompt for extracting job details"""
+        text = html_to_text(html_content)
+        return f"Extract key points from job posting: {truncate_to_tokens(text, MAX_JOB_TEXT_TOKENS)}"
+
+    def _parse_job_details(self, response):
+        """Read description and requirements from a JSON reply, or (None, None) if there are none"""
+        data = parse_json_response(response)
+        if data is not None:
+            desc, reqs = data.get('description') or "", data.get('requirements') or ""
+            if isinstance(reqs, list):
+                reqs = '; '.join(str(r) for r in reqs)
+            if not (desc or reqs):
+                return None, None
+            return str(desc), str(reqs)
+        
+        # Model ignored JSON mode, split the plain-text reply instead
+        if response:
+            parts = response.split('\n')
+            desc = parts[0] if len(parts) > 0 else ""
+            reqs = parts[1] if len(parts) > 1 else ""
+            return desc, reqs
+        return None, None
+
+    def _quick_score(self, title, description, requirements):
+        """Fraction of resume skills mentioned in the job title, description and requirements"""
+        if isinstance(requirements, (list, tuple)):
+            requirements = ' '.join(str(r) for r in requirements)
+        text = f"{title or ''} {description or ''} {requirements or ''}".lower()
+        tokens = set(_SKILL_TOKEN_RE.findall(text))
+        matches = sum(1 for skill in self._skills_set
+                      if (skill in text if ' ' in skill else skill in tokens))
+        return matches / max(1, len(self._skills_set))
+
+    def _prefilter_job(self, title, description, requirements):
+        """Approve obvious matches locally, or return None if the LLM is needed"""
+        if not self._skills_set:
+            return None
+        score = self._quick_score(title, description, requirements)
+        if score > MAX_SKILL_SCORE:
+            return True, SKILL_MATCH_REASON
+        return None
+
+    def _analyze_job_prompt(self, title, company):
+        """Build the prompt for analyzing a job"""
+        return f"Job: {title} at {company}. Skills: {self._key_skills}. Should I apply?"
+
+    def _parse_analysis(self, response):
+        """Parse apply decision and reason from an analysis response, or None if there was no reply"""
+        data = parse_json_response(response)
+        if data is not None and 'apply' in data:
+            should_apply = data['apply']
+            if isinstance(should_apply, str):
+                should_apply = should_apply.strip().lower() in ('true', 'yes')
+            return bool(should_apply), str(data.get('reason') or "")
+        
+        # Model ignored JSON mode, fall back to yes/no text parsing
+        if response:
+            should_apply = 'yes' in response.lower()
+            reason = response.split(',', 1)[1].strip() if ',' in response else response
+            return should_apply, reason
+        return None
+
+    def _cover_letter_prompt(self, job_data):
+        """Build the prompt for a cover letter"""
+        return f"Write brief cover letter: {job_data['title']} at {job_data['company']}. My experience: {self._key_experience}"
+
     def extract_job_details(self, html_content):
         """Extract job description and requirements from HTML content"""
         try:
-            # Extract text content from HTML
-            import re
-            text = re.sub(r'<[^>]+>', ' ', html_content)
-            text = ' '.join(text.split())  # Clean up whitespace
+            def extract():
+                response = self._make_api_request(
+                    self._job_details_prompt(html_content),
+                    system_prompt=JOB_DETAILS_SYSTEM_PROMPT,
+                    max_length=JOB_DETAILS_MAX_LENGTH,
+                    response_format=JSON_RESPONSE_FORMAT
+                )
+                return self._parse_job_details(response)
             
-            prompt = f"Extract key points from job posting: {text[:150]}"
-            response = self._make_api_request(prompt)
-            
-            if response:
-                try:
-                    # Split response into description and requirements
-                    parts = response.split('\n')
-                    desc = parts[0] if len(parts) > 0 else ""
-                    reqs = parts[1] if len(parts) > 1 else ""
-                    return desc, reqs
-                except:
-                    pass
+            return self._memoized(('details', content_hash(html_content)), extract)
+
+        except Exception as e:
+            logger.error(f"Failed to extract job details: {str(e)}")
             return None, None
-            
+
+    async def aextract_job_details(self, html_content):
+        """Extract job description and requirements from HTML content without blocking"""
+        try:
+            response = await self._amake_api_request(
+                self._job_details_prompt(html_content),
+                system_prompt=JOB_DETAILS_SYSTEM_PROMPT,
+                max_length=JOB_DETAILS_MAX_LENGTH,
+                response_format=JSON_RESPONSE_FORMAT
+            )
+            return self._parse_job_details(response)
+
         except Exception as e:
             logger.error(f"Failed to extract job details: {str(e)}")
             return None, None
 
     def analyze_job(self, title, company, description, requirements):
-        """Analyze if we should apply to this job based on resume match"""
+        """Analyze if we should apply to this job based on resume match; should_apply is None if analysis failed"""
         try:
-            # Get key skills from resume
-            skills = self.resume.get('skills', {})
-            langs = skills.get('programming_languages', [])
-            frameworks = skills.get('frameworks', [])
-            key_skills = ', '.join(langs[:3] + frameworks[:2])
+            decision = self._prefilter_job(title, description, requirements)
+            if decision is not None:
+                return decision
             
-            prompt = f"Job: {title} at {company}. Skills: {key_skills}. Match? (yes/no, reason)"
-            response = self._make_api_request(prompt)
+            def analyze():
+                response = self._make_api_request(
+                    self._analyze_job_prompt(title, company),
+                    system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                    response_format=JSON_RESPONSE_FORMAT
+                )
+                return self._parse_analysis(response)
             
-            if response:
-                try:
-                    # Parse yes/no from response
-                    should_apply = 'yes' in response.lower()
-                    reason = response.split(',', 1)[1].strip() if ',' in response else response
-                    return should_apply, reason
-                except:
-                    pass
-            return False, "Failed to analyze job"
+            # A failed analysis is not memoized, so the next call asks the API again
+            result = self._memoized(('analysis', title, company, content_hash(description)), analyze)
+            return result if result is not None else (None, ANALYSIS_FAILED_REASON)
+
+        except Exception as e:
+            logger.error(f"Failed to analyze job: {str(e)}")
+            return None, str(e)
+
+    async def aanalyze_job(self, title, company, description, requirements):
+        """Analyze if we should apply to this job without blocking; should_apply is None if analysis failed"""
+        try:
+            decision = self._prefilter_job(title, description, requirements)
+            if decision is not None:
+                return decision
             
+            response = await self._amake_api_request(
+                self._analyze_job_prompt(title, company),
+                system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                response_format=JSON_RESPONSE_FORMAT
+            )
+            result = self._parse_analysis(response)
+            return result if result is not None else (None, ANALYSIS_FAILED_REASON)
+
         except Exception as e:
             logger.error(f"Failed to analyze job: {str(e)}")
-            return False, str(e)
+            return None, str(e)
+
+    async def process_jobs(self, jobs):
+        """Analyze many jobs concurrently, returning results in input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze(job):
+            async with semaphore:
+                return await self.aanalyze_job(
+                    job.get('title'),
+                    job.get('company'),
+                    job.get('description'),
+                    job.get('requirements')
+                )
+
+        return await asyncio.gather(*(analyze(job) for job in jobs))
 
     def generate_cover_letter(self, job_data):
         """Generate a cover letter for the job"""
         try:
-            # Get key experience
-            exp = self.resume.get('experience', [])[0] if self.resume.get('experience') else {}
-            key_exp = f"{exp.get('title')} at {exp.get('company')}" if exp else ""
-            
-            prompt = f"Write brief cover letter: {job_data['title']} at {job_data['company']}. My experience: {key_exp}"
-            return self._make_api_request(prompt)
-            
+            return self._make_api_request(self._cover_letter_prompt(job_data), temperature=None)
+
         except Exception as e:
             logger.error(f"Failed to generate cover letter: {str(e)}")
             return None
 
+    async def agenerate_cover_letter(self, job_data):
+        """Generate a cover letter for the job without blocking"""
+        try:
+            return await self._amake_api_request(self._cover_letter_prompt(job_data), temperature=None)
+
+        except Exception as e:
+            logger.error(f"Failed to generate cover letter: {str(e)}")
+            return None
+
+    def generate_cover_letter_stream(self, job_data):
+        """Yield cover letter text as it is generated"""
+        stream = None
+        try:
+            request = self._build_request(self._cover_letter_prompt(job_data), DEFAULT_SYSTEM_PROMPT,
+                                          200, None, None)
+            stream = api.chat.completions.create(stream=True, **request)
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"Failed to stream cover letter: {str(e)}")
+        finally:
+            # Closing early releases the connection if the caller stops reading
+            if stream is not None:
+                stream.close()
+
+    async def agenerate_cover_letter_stream(self, job_data):
+        """Yield cover letter text as it is generated without blocking"""
+        stream = None
+        try:
+            request = self._build_request(self._cover_letter_prompt(job_data), DEFAULT_SYSTEM_PROMPT,
+                                          200, None, None)
+            async with self._limiter:
+                stream = await async_api.chat.completions.create(stream=True, **request)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"Failed to stream cover letter: {str(e)}")
+        finally:
+            if stream is not None:
+                await stream.close()
+
     def suggest_form_answers(self, questions):
         """Suggest answers for application form questions"""
         try:
+            if not questions:
+                return {}
+
+            keys = list(questions.keys())
+
+            # Ask all questions in a single request, one numbered line each
+            prompt = f"Resume:\n{self._resume_summary}\n"
+            prompt += "Answer each job question based on resume. Reply with lines 'A<n>: <answer>'.\n"
+            prompt += "\n".join(f"Q{i}: {text[:100]}" for i, text in enumerate(questions.values()))
+            response = self._make_api_request(
+                prompt,
+                max_length=len(prompt),
+                max_tokens=100 * len(keys)
+            )
+
             answers = {}
-            for q, text in questions.items():
-                prompt = f"Answer job question based on resume. Q: {text[:100]}"
+            if response:
+                for idx, answer in _ANSWER_LINE_RE.findall(response):
+                    idx = int(idx)
+                    if idx < len(keys) and answer.strip():
+                        answers[keys[idx]] = answer.strip()
+
+            # Fall back to single requests for questions missing from the batch reply
+            for q in keys:
+                if q in answers:
+                    continue
+                prompt = f"Answer job question based on resume. Q: {questions[q][:100]}"
                 answer = self._make_api_request(prompt)
                 if answer:
                     answers[q] = answer
             return answers
-            
+
         except Exception as e:
             logger.error(f"Failed to suggest form answers: {str(e)}")
             return {}
+
+    def get_form_field_value(self, field_label, field_type, options=None):
+        """Suggest a value for an application form field"""
+        try:
+            # Answer common fields from the resume without calling the model
+            label = (field_label or '').strip().lower()
+            for pattern, key in self._field_patterns:
+                if pattern.match(label):
+                    value = self._field_map[key]
+                    if not options or value in options:
+                        return value
+                    break
+            
+            def suggest():
+                options_text = FIELD_OPTIONS_PROMPT.format(options=join_options(tuple(options))) if options else ""
+                prompt = self._field_prompt(label=field_label, type=field_type, options=options_text)
+                
+                response = self._make_api_request(prompt, max_length=1000, max_tokens=50)
+                return response.strip() if response else None
+            
+            # The same labels ("Phone", "City") recur on nearly every application
+            return self._memoized(('field', field_label, field_type, tuple(options or ())), suggest)
+            
+        except Exception as e:
+            logger.error(f"Failed to get form field value: {str(e)}")
+            return None
+
+    def handle_screening_question(self, question_text, options=None):
+        """Answer a screening question based on the resume"""
+        try:
+            def answer():
+                if options:
+                    prompt = self._choice_question_prompt(question=question_text, options=join_options(tuple(options)))
+                else:
+                    # Free-text answers get the full resume for context
+                    prompt = self._open_question_prompt(question=question_text)
+                
+                response = self._make_api_request(prompt, max_length=len(prompt), max_tokens=150)
+                return response.strip() if response else None
+            
+            # Screening questions repeat verbatim across postings
+            return self._memoized(('question', question_text, tuple(options or ())), answer)
+            
+        except Exception as e:
+            logger.error(f"Failed to answer screening question: {str(e)}")
+            return None
+
+_shared_assistant = None
+_shared_lock = threading.Lock()
+
+def get_assistant():
+    """Process-wide AIJobAssistant so its caches and API connections span every job"""
+    global _shared_assistant
+    if _shared_assistant is None:
+        with _shared_lock:
+            if _shared_assistant is None:
+                _shared_assistant = AIJobAssistant()
+    return _shared_assistant
@@ -2,9 +2,9 @@ import os
 from dotenv import load_dotenv
 
 # Default to development if not set
-ENV = os.getenv('PYTHON_ENV', 'development')
+ENV = os.environ.get('PYTHON_ENV', 'development')
 
-# Load the appropriate .env file
+# Load the appropriate .env file once, at import time
 if ENV == 'production':
     load_dotenv('.env.production')
 elif ENV == 'staging':
@@ -19,21 +19,27 @@ class Config:
     TESTING = ENV == 'test'
     
     # LinkedIn credentials
-    LINKEDIN_EMAIL = os.getenv('LINKEDIN_EMAIL')
-    LINKEDIN_PASSWORD = os.getenv('LINKEDIN_PASSWORD')
+    LINKEDIN_EMAIL = os.environ.get('LINKEDIN_EMAIL')
+    LINKEDIN_PASSWORD = os.environ.get('LINKEDIN_PASSWORD')
+    
+    # AI settings
+    AIML_API_KEY = os.environ.get('AIML_API_KEY')
+    AI_REQUESTS_PER_MINUTE = int(os.environ.get('AI_REQUESTS_PER_MINUTE', '60'))
     
     # Job search parameters
-    JOB_SEARCH_KEYWORDS = os.getenv('JOB_SEARCH_KEYWORDS')
-    JOB_SEARCH_LOCATION = os.getenv('JOB_SEARCH_LOCATION')
-    MAX_JOBS = int(os.getenv('MAX_JOBS', '25'))
+    JOB_SEARCH_KEYWORDS = os.environ.get('JOB_SEARCH_KEYWORDS')
+    JOB_SEARCH_LOCATION = os.environ.get('JOB_SEARCH_LOCATION')
+    MAX_JOBS = int(os.environ.get('MAX_JOBS', '25'))
+    # Semicolon-separated regexes; jobs whose title matches one are skipped without the AI
+    SKIP_TITLE_PATTERNS = [p.strip() for p in os.environ.get('SKIP_TITLE_PATTERNS', '').split(';') if p.strip()]
     
     # Browser settings
     BROWSER_HEADLESS = ENV == 'production'
-    BROWSER_TIMEOUT = int(os.getenv('BROWSER_TIMEOUT', '10'))
+    BROWSER_TIMEOUT = int(os.environ.get('BROWSER_TIMEOUT', '10'))
     
     # Logging settings
     LOG_LEVEL = 'INFO' if ENV == 'production' else 'DEBUG'
-    LOG_MODE = os.getenv('LOG_MODE', 'file').lower()
+    LOG_MODE = os.environ.get('LOG_MODE', 'file').lower()
     LOG_DIR = '.logs' if LOG_MODE != 'print' else None
     
     @classmethod
@@ -1,25 +1,61 @@
 import os
+import json
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
-def make_api_request(prompt, api_key):
+BATCH_API_URL = 'https://api.aimlapi.com/v1'
+BATCH_MODEL = 'mistralai/Mistral-7B-Instruct-v0.2'
+CHAT_API_URL = 'https://aimlapi.com/api/chat'
+MAX_WORKERS = 8
+
+# Seconds to wait on an API response; uploading the batch input file gets longer
+REQUEST_TIMEOUT = 30
+UPLOAD_TIMEOUT = 120
+
+def build_request_body(prompt):
+    """Build the chat request body for a resume prompt"""
+    return {
+        'messages': [
+            {'role': 'system', 'content': 'You are a professional resume writer. Be concise and professional.'},
+            {'role': 'user', 'content': prompt}
+        ],
+        'temperature': 0.7,
+        'max_tokens': 500
+    }
+
+def create_session(api_key):
+    """Create a keep-alive HTTP session with connection pooling and retries"""
+    session = requests.Session()
+    # Only idempotent methods are retried by default: a retried batch or file POST
+    # can create a duplicate batch that is billed twice
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+    # A repeated chat completion only costs one more completion, so its POSTs are retried too
+    chat_retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None
+    )
+    session.mount(CHAT_API_URL, HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=chat_retries))
+    session.headers.update({'Authorization': f'Bearer {api_key}'})
+    return session
+
+def make_api_request(prompt, api_key, session=None):
     """Make a request to AIML API"""
     try:
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
+        session = session or create_session(api_key)
+        data = build_request_body(prompt)
         
-        data = {
-            'messages': [
-                {'role': 'system', 'content': 'You are a professional resume writer. Be concise and professional.'},
-                {'role': 'user', 'content': prompt}
-            ],
-            'temperature': 0.7,
-            'max_tokens': 500
-        }
-        
-        response = requests.post('https://aimlapi.com/api/chat', headers=headers, json=data)
+        response = session.post(CHAT_API_URL, json=data, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         return response.json()['choices'][0]['message']['content'].strip()
@@ -28,6 +64,76 @@ def make_api_request(prompt, api_key):
         print(f"API request failed: {str(e)}")
         return None
 
+def make_batch_request(prompts, session, poll_interval=30, timeout=3600):
+    """Run all prompts through the Batch API (upload, create, poll, download)"""
+    try:
+        # One JSONL line per prompt, keyed by section name
+        lines = [
+            json.dumps({
+                'custom_id': key,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {'model': BATCH_MODEL, **build_request_body(prompt)}
+            })
+            for key, prompt in prompts.items()
+        ]
+        
+        upload = session.post(
+            f'{BATCH_API_URL}/files',
+            data={'purpose': 'batch'},
+            files={'file': ('resume_sections.jsonl', '\n'.join(lines))},
+            timeout=UPLOAD_TIMEOUT
+        )
+        upload.raise_for_status()
+        
+        batch = session.post(
+            f'{BATCH_API_URL}/batches',
+            json={
+                'input_file_id': upload.json()['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': '24h'
+            },
+            timeout=REQUEST_TIMEOUT
+        )
+        batch.raise_for_status()
+        batch = batch.json()
+        
+        # Poll until the batch finishes
+        start_time = time.time()
+        while batch['status'] not in ('completed', 'failed', 'expired', 'cancelled'):
+            if time.time() - start_time > timeout:
+                print(f"Batch {batch['id']} did not finish within {timeout} seconds")
+                return None
+            print(f"Batch status: {batch['status']}, checking again in {poll_interval} seconds...")
+            time.sleep(poll_interval)
+            response = session.get(f"{BATCH_API_URL}/batches/{batch['id']}", timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            batch = response.json()
+        
+        if batch['status'] != 'completed' or not batch.get('output_file_id'):
+            print(f"Batch finished with status: {batch['status']}")
+            return None
+        
+        output = session.get(f"{BATCH_API_URL}/files/{batch['output_file_id']}/content", timeout=REQUEST_TIMEOUT)
+        output.raise_for_status()
+        
+        # Reassemble results by section name
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            try:
+                content = result['response']['body']['choices'][0]['message']['content']
+                results[result['custom_id']] = content.strip()
+            except (KeyError, IndexError, TypeError):
+                print(f"No content returned for {result.get('custom_id')}")
+        return results
+        
+    except Exception as e:
+        print(f"Batch request failed: {str(e)}")
+        return None
+
 def generate_resume_content():
     """Generate resume content using AI"""
     load_dotenv('.env.local')
@@ -59,14 +165,28 @@ def generate_resume_content():
         'RESUME_CURRENT_TITLE': "Generate current job title for a software engineer"
     }
     
-    # Generate content for each section
-    resume_content = {}
-    for key, prompt in sections.items():
-        print(f"\nGenerating {key}...")
-        content = make_api_request(prompt, api_key)
-        if content:
-            resume_content[key] = content
-            print(f"{key} = {content}")
+    # Generate all sections in one batch, falling back to one request per section
+    print("\nSubmitting batch request for all sections...")
+    session = create_session(api_key)
+    resume_content = make_batch_request(sections, session)
+    if resume_content is None:
+        print("Batch API unavailable, generating sections concurrently")
+        resume_content = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(make_api_request, prompt, api_key, session): key
+                for key, prompt in sections.items()
+            }
+            for future in as_completed(futures):
+                content = future.result()
+                if content:
+                    resume_content[futures[future]] = content
+    
+    # Results arrive out of order, keep the section order
+    resume_content = {key: resume_content[key] for key in sections if key in resume_content}
+    for key in sections:
+        if key in resume_content:
+            print(f"{key} = {resume_content[key]}")
         else:
             print(f"Failed to generate {key}")
     
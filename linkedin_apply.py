@@ -2,124 +2,343 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.keys import Keys
-import time
+from selenium.webdriver.common.action_chains import ActionChains
 import os
+import re
 import json
-from ai_assistant import AIJobAssistant
-from selenium.webdriver.support.select import Select
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from ai_assistant import get_assistant, SKILL_MATCH_REASON
+from config import Config
 
+from linkedin_login import LinkedInLogin
 from utils.logger import setup_logger
+from utils.browser import browser_pool, cleanup_driver, POOL_SIZE
 from utils.chrome_setup import ChromeSetup
 
 # Set up logger
 logger = setup_logger("linkedin_apply")
 
+JOB_DESCRIPTION_CSS = "div.jobs-description"
+
+# Easy Apply button: one CSS union, then one XPath fallback
+EASY_APPLY_CSS = ", ".join([
+    "button.jobs-apply-button",
+    "button[aria-label*='Easy Apply']",
+    "button.jobs-apply-button--top-card",
+    "button[data-control-name='jobdetails_topcard_inapply']",
+    ".jobs-apply-button--top-card",
+    ".jobs-s-apply button"
+])
+EASY_APPLY_XPATH = "//*[contains(@class, 'jobs-apply-button') or contains(text(), 'Easy Apply')]"
+EASY_APPLY_MODAL_CSS = "div[data-test-modal-id='easy-apply-modal'], div.jobs-easy-apply-modal, div.jobs-easy-apply-content"
+
+# Wait conditions built once and reused on every job
+EASY_APPLY_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, EASY_APPLY_CSS))
+EASY_APPLY_MODAL_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, EASY_APPLY_MODAL_CSS))
+
+# Buttons that move the application forward
+SUBMIT_BUTTON_CSS = "button[aria-label='Submit application'], button[type='submit']"
+NEXT_BUTTON_CSS = "button[aria-label*='Continue to next step'], button[aria-label*='Next'], button[type='button']"
+NEXT_OR_SUBMIT_CSS = ", ".join([
+    "button[aria-label='Submit application']",
+    "button[aria-label='Continue to next step']",
+    "button[aria-label='Review your application']",
+    "button[type='submit']"
+])
+
+# Confirmation text shown once an application has gone through
+APPLICATION_SENT_XPATH = "//*[contains(text(), 'application was sent')]"
+CONFIRMATION_XPATHS = (
+    "//div[contains(text(), 'Application submitted')]",
+    "//h3[contains(text(), 'Application submitted')]",
+    "//span[contains(text(), 'Application sent')]",
+    "//div[contains(text(), 'successfully submitted')]"
+)
+# Only the confirmation itself counts after a submit, as one XPath union
+CONFIRMATION_XPATH = " | ".join((APPLICATION_SENT_XPATH,) + CONFIRMATION_XPATHS)
+
+# "Applied" badges and "Done" buttons also appear on pages that were never just submitted,
+# so they only count when probing a page that may already show a finished application
+SUCCESS_XPATH = " | ".join((
+    CONFIRMATION_XPATH,
+    "//span[contains(text(), 'Applied')]",
+    "//span[contains(text(), 'Done')]"
+))
+
+# Met as soon as a submit confirmation appears; one lookup per poll
+SUCCESS_CONDS = EC.presence_of_element_located((By.XPATH, CONFIRMATION_XPATH))
+
+# The confirmation shows up right after a successful submit
+SUCCESS_TIMEOUT = 3
+
+# Resources the apply flow never needs: images, fonts, video and tracking beacons
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.svg", "*.woff*", "*.mp4",
+    "*/li/track*", "*collect*"
+]
+
+# Common loading indicator selectors in LinkedIn
+LOADING_SELECTORS = ", ".join([
+    "div.artdeco-loader",
+    "div.artdeco-modal__loader",
+    "div.loading-icon",
+    "div.loading-animation",
+    "div[role='progressbar']",
+    "div.artdeco-spinner",
+    ".artdeco-modal__loading"
+])
+
+# Flags window.__stepChanged whenever the Easy Apply modal's content is replaced
+OBSERVE_STEP_JS = """
+const root = document.querySelector(arguments[0]) || document.body;
+if (window.__stepObserver) window.__stepObserver.disconnect();
+window.__stepChanged = false;
+window.__stepObserver = new MutationObserver(() => { window.__stepChanged = true; });
+window.__stepObserver.observe(root, {childList: true, subtree: true});
+"""
+
+# Reads and resets the step flag
+STEP_CHANGED_JS = "const c = window.__stepChanged; window.__stepChanged = false; return c;"
+
+# Clicks the step's primary button, Submit before Next, and reports which one it clicked.
+# Each entry of arguments[0] is [kind, selector, needles]; the button must be visible,
+# enabled and have a needle in its text or aria-label.
+CLICK_STEP_BUTTON_JS = """
+for (const [kind, css, needles] of arguments[0]) {
+    for (const e of document.querySelectorAll(css)) {
+        const r = e.getBoundingClientRect();
+        const visible = r.width > 0 && r.height > 0 && getComputedStyle(e).visibility !== 'hidden';
+        const text = (e.innerText + ' ' + (e.getAttribute('aria-label') || '')).toLowerCase();
+        if (visible && !e.disabled && needles.some(n => text.includes(n))) {
+            window.__stepChanged = false;
+            e.click();
+            return kind;
+        }
+    }
+}
+return null;
+"""
+
+# Primary buttons of an Easy Apply step, in the order they are tried
+STEP_BUTTONS = [
+    ['submit', SUBMIT_BUTTON_CSS, ['submit']],
+    ['next', NEXT_BUTTON_CSS, ['next', 'continue']]
+]
+
+# Clicks the first enabled, rendered match for a selector and reports whether it did
+CLICK_FIRST_JS = """(() => {
+    const e = [...document.querySelectorAll(%s)].find(el => !el.disabled && el.getClientRects().length);
+    if (!e) return false;
+    e.scrollIntoView();
+    e.click();
+    return true;
+})()"""
+
+# Form controls filled by fill_application_form
+FORM_FIELD_SELECTOR = "input[type], select, textarea, div[role='textbox']"
+
+# In-page agent that collects and fills a whole form step per call
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'linkedin_form_agent.js')) as f:
+    FORM_AGENT_JS = f.read()
+
+# Calls an already installed agent, or reports that the page needs it injected
+FORM_AGENT_MISSING = "__lla_missing__"
+FORM_AGENT_CALL_JS = "return window.__lla ? window.__lla.{method}(...arguments) : '" + FORM_AGENT_MISSING + "';"
+
+# Seconds between checks in explicit waits; Selenium's default of 0.5 adds up to half a second per wait
+POLL_FREQUENCY = 0.1
+
+# Title rules checked before any page read or AI call
+SKIP_TITLE_PATTERNS = [re.compile(pattern, re.I) for pattern in Config.SKIP_TITLE_PATTERNS]
+
+# Upper bound on Next/Review clicks for one application
+MAX_FORM_STEPS = 10
+
+# Concurrent AI requests when answering a form step
+AI_WORKERS = 10
+
+# Seconds to wait for the background apply decision before clicking Easy Apply
+AI_DECISION_TIMEOUT = 15
+
+
 class LinkedInApply:
-    def __init__(self, driver=None, db_manager=None):
+    def __init__(self, driver=None, db_manager=None, pool=None, ai_assistant=None):
         """Initialize LinkedIn Apply"""
-        self.driver = driver or ChromeSetup.initialize_driver()
-        self.wait = WebDriverWait(self.driver, 10)
+        # Borrow a warm browser from the pool unless the caller owns the driver
+        self.pool = None if driver else (pool or browser_pool)
+        self.driver = driver or self.pool.acquire()
+        # Rely on explicit waits only; an implicit wait would stack on every failed lookup
+        self.driver.implicitly_wait(0)
+        self.wait = WebDriverWait(self.driver, 5, poll_frequency=POLL_FREQUENCY)
+        self._block_heavy_resources()
         self.db_manager = db_manager
-        self.ai_assistant = AIJobAssistant()
+        self.ai_assistant = ai_assistant or get_assistant()
+        self._executor = ThreadPoolExecutor(max_workers=AI_WORKERS)
+
+    def _block_heavy_resources(self):
+        """Block images, fonts and analytics through CDP so pages load faster"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except (AttributeError, WebDriverException) as e:
+            # Only Chromium drivers speak CDP
+            logger.debug(f"Could not block resources: {str(e)}")
+
+    def close(self):
+        """Return a pooled driver so the next job can reuse it"""
+        self._executor.shutdown(wait=False)
+        if self.pool and self.driver:
+            self.pool.release(self.driver)
+            self.driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _wait_for(self, css, timeout=5):
+        """Wait until an element matching the CSS selector is present and return it"""
+        return WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+
+    def _wait_for_form_step(self, timeout=10):
+        """Wait for the modal observer to report that the form moved to a new step"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+                lambda d: d.execute_script(STEP_CHANGED_JS))
+            return True
+        except TimeoutException:
+            return False
+
+    def _cdp_click(self, selector):
+        """Click the first enabled match for a selector via CDP, without fetching an element handle"""
+        expression = CLICK_FIRST_JS % json.dumps(selector)
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True})
+            return bool(result.get('result', {}).get('value'))
+        except (AttributeError, WebDriverException):
+            # Non-Chromium drivers: same script over the regular WebDriver channel
+            return bool(self.driver.execute_script("return " + expression))
+
+    def _pointer_click(self, element):
+        """Move the pointer onto an element once it is clickable and click it"""
+        element = self.wait.until(EC.element_to_be_clickable(element))
+        ActionChains(self.driver).move_to_element(element).click().perform()
+        return True
+
+    def _click_step_button(self):
+        """Click the current step's Submit or Next button in one round-trip; returns which, or None"""
+        return self.driver.execute_script(CLICK_STEP_BUTTON_JS, STEP_BUTTONS)
+
+    def wait_for_loading_modal(self, timeout=10):
+        """Wait for any loading indicators in the modal to disappear"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(EC.invisibility_of_element_located(
+                (By.CSS_SELECTOR, LOADING_SELECTORS)))
+            return True
+        except TimeoutException:
+            logger.warning("Loading indicator still visible, continuing")
+            return False
 
     def apply_to_job(self, job_data):
         """Apply to a job"""
         try:
-            # First, get the job description
+            # Titles ruled out by config are rejected locally
+            reason = self._prefilter(job_data)
+            if reason:
+                logger.info(f"Prefilter rejected {job_data.get('title')}: {reason}")
+                return False
+            
+            # Jobs already recorded need neither a page read nor the AI
+            job_id = job_data.get('id')
+            if self.db_manager and job_id and self.db_manager.has_seen(job_id):
+                logger.info(f"Skipping already recorded job: {job_data.get('title')}")
+                return False
+            
+            # Reuse an earlier decision for this job, or for the same role re-posted, instead of re-running the AI
+            cached = None
+            if self.db_manager:
+                cached = self.db_manager.get_analysis(job_id) if job_id else None
+                if cached is None and job_data.get('company') and job_data.get('title'):
+                    cached = self.db_manager.get_role_analysis(job_data['company'], job_data['title'])
+            if cached:
+                if not cached['should_apply']:
+                    logger.info(f"Skipping previously rejected job: {cached['reason']}")
+                    return False
+                logger.info(f"Using saved analysis: {cached['reason']}")
+            
+            # Start the AI analysis in the background while the Easy Apply button is located
+            decision = None
+            if cached is None:
+                try:
+                    # Wait for job details to load
+                    description_elem = self._wait_for(JOB_DESCRIPTION_CSS, timeout=10)
+                    page_source = description_elem.get_attribute('innerHTML')
+                    decision = self._executor.submit(self._ai_decide, job_data, page_source)
+                except WebDriverException as e:
+                    logger.warning(f"Could not analyze job with AI: {str(e)}")
+            
+            # Check for Easy Apply button with one CSS union query, then one XPath fallback
+            # Wait until the button appears instead of sleeping
             try:
-                # Wait for job details to load
-                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.jobs-description")))
-                time.sleep(2)  # Give extra time for content to load
+                self.wait.until(EASY_APPLY_PRESENT)
+            except TimeoutException:
+                logger.debug("No Easy Apply button appeared, trying XPath selectors")
+            
+            candidates = (self.driver.find_elements(By.CSS_SELECTOR, EASY_APPLY_CSS) or
+                          self.driver.find_elements(By.XPATH, EASY_APPLY_XPATH))
+            easy_apply_button = next(
+                (button for button in candidates if button.is_displayed() and button.is_enabled()), None)
+            
+            if easy_apply_button:
+                logger.info("Found Easy Apply button")
                 
-                description_elem = self.driver.find_element(By.CSS_SELECTOR, "div.jobs-description")
-                page_source = description_elem.get_attribute('innerHTML')
+                # Only click once the AI agrees this job is worth applying to
+                if decision is not None:
+                    try:
+                        should_apply, reason = decision.result(timeout=AI_DECISION_TIMEOUT)
+                        if should_apply is None:
+                            logger.warning(f"Could not analyze job with AI: {reason}")
+                            return False
+                        if not should_apply:
+                            logger.info(f"AI suggests not applying: {reason}")
+                            return False
+                        logger.info(f"AI suggests applying: {reason}")
+                    except Exception as e:
+                        logger.warning(f"Could not analyze job with AI: {str(e)}")
                 
-                # Extract job details using AI
-                description, requirements = self.ai_assistant.extract_job_details(page_source)
+                # Click in the page first, then with a real pointer once the button is clickable;
+                # both scroll the button into view themselves
+                click_successful = False
+                click_methods = [
+                    lambda: self._cdp_click(EASY_APPLY_CSS),
+                    lambda: self._pointer_click(easy_apply_button)
+                ]
                 
-                if description and requirements:
-                    # Analyze job with AI
-                    should_apply, reason = self.ai_assistant.analyze_job(
-                        job_data['title'],
-                        job_data['company'],
-                        description,
-                        requirements
-                    )
-                    
-                    if not should_apply:
-                        logger.info(f"AI suggests not applying: {reason}")
-                        return False
-                    
-                    logger.info(f"AI suggests applying: {reason}")
+                for click_method in click_methods:
+                    try:
+                        # Verify if the Easy Apply modal appeared
+                        if click_method() and self.wait.until(EASY_APPLY_MODAL_PRESENT):
+                            click_successful = True
+                            break
+                    except (WebDriverException, TimeoutException) as e:
+                        logger.debug("Click method failed: %s", e)
+                        continue
                 
-            except Exception as e:
-                logger.warning(f"Could not analyze job with AI: {str(e)}")
-            
-            # Check for Easy Apply button with multiple selectors and strategies
-            easy_apply_selectors = [
-                "button.jobs-apply-button",
-                "button[aria-label*='Easy Apply']",
-                "button.jobs-apply-button--top-card",
-                "button[data-control-name='jobdetails_topcard_inapply']",
-                ".jobs-apply-button--top-card",
-                ".jobs-s-apply button",
-                "//*[contains(@class, 'jobs-apply-button')]",  # XPath
-                "//*[contains(text(), 'Easy Apply')]"  # XPath for text content
-            ]
-            
-            time.sleep(3)  # Wait before looking for button
-            
-            # Try each selector
-            for selector in easy_apply_selectors:
-                try:
-                    # Try both CSS and XPath selectors
-                    if selector.startswith("/"):
-                        easy_apply_button = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        easy_apply_button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                if click_successful:
+                    logger.info("Successfully clicked Easy Apply button and modal appeared")
                     
-                    if easy_apply_button and easy_apply_button.is_displayed() and easy_apply_button.is_enabled():
-                        logger.info(f"Found Easy Apply button with selector: {selector}")
-                        
-                        # Scroll to button to ensure it's in view
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", easy_apply_button)
-                        time.sleep(2)  # Wait after scroll
-                        
-                        # Try multiple click strategies
-                        click_successful = False
-                        click_methods = [
-                            lambda: self.driver.execute_script("arguments[0].click();", easy_apply_button),
-                            lambda: easy_apply_button.click(),
-                            lambda: self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector))).click()
-                        ]
-                        
-                        for click_method in click_methods:
-                            try:
-                                click_method()
-                                time.sleep(2)  # Wait after click
-                                
-                                # Verify if the Easy Apply modal appeared
-                                if self.wait.until(EC.presence_of_element_located(
-                                    (By.CSS_SELECTOR, "div[data-test-modal-id='easy-apply-modal']"))):
-                                    click_successful = True
-                                    break
-                            except Exception as e:
-                                logger.debug(f"Click method failed: {str(e)}")
-                                continue
-                        
-                        if click_successful:
-                            logger.info("Successfully clicked Easy Apply button and modal appeared")
-                            
-                            # Handle the application process
-                            if self.handle_easy_apply_process():
-                                time.sleep(2)
-                                return True
-                            break
-                except Exception as e:
-                    logger.debug(f"Button not found with selector {selector}: {str(e)}")
-                    continue
+                    # Handle the application process
+                    if self.handle_easy_apply_process():
+                        if self.db_manager and job_id:
+                            self.db_manager.add_job({**job_data, 'job_id': job_id, 'status': 'applied'})
+                        return True
             
             logger.info("No enabled Easy Apply button found or failed to click it")
             return False
@@ -135,194 +354,136 @@ class LinkedInApply:
                 )
             return False
 
+    def _prefilter(self, job_data):
+        """Return a reason to skip the job from its title alone, or None"""
+        title = job_data.get('title') or ''
+        for pattern in SKIP_TITLE_PATTERNS:
+            if pattern.search(title):
+                return f"title matches '{pattern.pattern}'"
+        return None
+
+    def _ai_decide(self, job_data, page_source):
+        """Extract job details and decide whether to apply, saving the decision"""
+        description, requirements = self.ai_assistant.extract_job_details(page_source)
+        if not (description and requirements):
+            return True, "No job details extracted"
+        
+        should_apply, reason = self.ai_assistant.analyze_job(
+            job_data['title'],
+            job_data['company'],
+            description,
+            requirements
+        )
+        
+        # Only LLM verdicts are saved; failed analyses and local skill matches are redone next time
+        job_id = job_data.get('id')
+        if self.db_manager and job_id and should_apply is not None and reason != SKILL_MATCH_REASON:
+            self.db_manager.save_analysis(job_id, should_apply, reason,
+                                          company=job_data['company'], title=job_data['title'])
+        return should_apply, reason
+
     def fill_application_form(self):
         """Fill out the application form"""
         try:
             # Wait for form to load
-            time.sleep(3)
+            self._wait_for(FORM_FIELD_SELECTOR, timeout=10)
             
-            while True:
+            # Watch the modal so step changes are a cheap flag check rather than a re-query
+            self.driver.execute_script(OBSERVE_STEP_JS, EASY_APPLY_MODAL_CSS)
+            
+            last_progress = None
+            for _ in range(MAX_FORM_STEPS):
                 try:
-                    # Look for form fields
-                    form_fields = self.driver.find_elements(By.CSS_SELECTOR, 
-                        "input[type], select, textarea, div[role='textbox']")
+                    # One call gathers every unfilled field and screening question on this step
+                    step = self._form_agent('collectStep', EASY_APPLY_MODAL_CSS)
                     
-                    if not form_fields:
+                    # Same progress as the last pass means the click did not advance the form
+                    if step['progress'] is not None and step['progress'] == last_progress:
+                        logger.debug("Form progress did not change, stopping")
                         break
+                    last_progress = step['progress']
                     
-                    # Process each field
-                    for field in form_fields:
-                        try:
-                            # Get field properties
-                            field_type = field.get_attribute('type') or field.tag_name
-                            field_label = self._get_field_label(field)
-                            
-                            # Get options for select fields
-                            options = None
-                            if field_type == 'select':
-                                options = [opt.text for opt in field.find_elements(By.TAG_NAME, 'option')]
-                            
-                            # Get AI suggestion for field value
-                            value = self.ai_assistant.get_form_field_value(field_label, field_type, options)
-                            
-                            if value and value != 'SKIP':
-                                # Fill in the field
-                                if field_type == 'select':
-                                    select = Select(field)
-                                    try:
-                                        select.select_by_visible_text(value)
-                                    except:
-                                        select.select_by_index(0)  # Default to first option
-                                else:
-                                    # Clear and fill text fields
-                                    field.clear()
-                                    field.send_keys(value)
-                                
-                                logger.info(f"Filled field '{field_label}' with '{value}'")
-                                time.sleep(1)  # Short wait between fields
-                            
-                        except Exception as e:
-                            logger.debug(f"Error filling field: {str(e)}")
-                            continue
-                    
-                    # Look for screening questions
-                    questions = self.driver.find_elements(By.CSS_SELECTOR,
-                        "div.jobs-easy-apply-form-section__grouping")
+                    # One call fills all answers and clicks Next/Review/Submit; steps with
+                    # nothing left to fill (e.g. review) still need their button clicked
+                    answers = self._answer_form_step(step) if step['fields'] or step['questions'] else {}
+                    result = self._form_agent('fillAndAdvance', answers)
+                    for label, value in result['filled']:
+                        logger.info(f"Filled field '{label}' with '{value}'")
                     
-                    for question in questions:
-                        try:
-                            question_text = question.find_element(By.CSS_SELECTOR, 
-                                "label, span.jobs-easy-apply-form-element__label").text
-                            
-                            # Get options if multiple choice
-                            options = None
-                            try:
-                                options = [opt.text for opt in question.find_elements(By.CSS_SELECTOR,
-                                    "input[type='radio'] + label, select option")]
-                            except:
-                                pass
-                            
-                            # Get AI answer
-                            answer = self.ai_assistant.handle_screening_question(question_text, options)
-                            
-                            if answer and answer != 'SKIP':
-                                # Find input field
-                                input_field = question.find_element(By.CSS_SELECTOR,
-                                    "input[type='text'], textarea, select, input[type='radio']")
-                                
-                                # Fill in the answer
-                                if input_field.get_attribute('type') == 'radio':
-                                    # Find radio button with matching label
-                                    radio_buttons = question.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                                    for radio in radio_buttons:
-                                        label = radio.find_element(By.XPATH, "following-sibling::label").text
-                                        if label.lower() == answer.lower():
-                                            radio.click()
-                                            break
-                                else:
-                                    input_field.clear()
-                                    input_field.send_keys(answer)
-                                
-                                logger.info(f"Answered question '{question_text}' with '{answer}'")
-                                time.sleep(1)
-                            
-                        except Exception as e:
-                            logger.debug(f"Error handling question: {str(e)}")
-                            continue
-                    
-                    # Look for next/submit button
-                    buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                        "button[aria-label*='Submit'], button[aria-label*='Next'], button[aria-label*='Review']")
-                    
-                    if not buttons:
+                    if not result['advanced']:
+                        break
+                    if not self._wait_for_form_step():
+                        logger.debug("Form step did not change after click")
                         break
-                        
-                    for button in buttons:
-                        if button.is_enabled():
-                            button.click()
-                            time.sleep(3)  # Wait after button click
-                            break
                             
-                except Exception as e:
-                    logger.debug(f"Error in form filling loop: {str(e)}")
+                except WebDriverException as e:
+                    logger.debug("Error in form filling loop: %s", e)
                     break
             
             # Check for success indicators
-            time.sleep(3)  # Wait before checking success
-            success_indicators = [
-                "//span[contains(text(), 'Application sent')]",
-                "//span[contains(text(), 'Done')]",
-                "//div[contains(text(), 'successfully submitted')]"
-            ]
-            
-            for indicator in success_indicators:
-                if len(self.driver.find_elements(By.XPATH, indicator)) > 0:
-                    logger.info("Application submitted successfully")
-                    return True
-            
+            if self.check_application_completed(timeout=5):
+                logger.info("Application submitted successfully")
+                return True
             return False
             
         except Exception as e:
             logger.error(f"Error filling application form: {str(e)}")
             return False
             
-    def _get_field_label(self, field):
-        """Get the label text for a form field"""
-        try:
-            # Try to find label by for attribute
-            field_id = field.get_attribute('id')
-            if field_id:
-                label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{field_id}']")
-                return label.text.strip()
-            
-            # Try to find label in parent elements
-            parent = field.find_element(By.XPATH, ".//ancestor::div[contains(@class, 'form-group')]")
-            label = parent.find_element(By.TAG_NAME, 'label')
-            return label.text.strip()
-            
-        except:
-            # Return placeholder or name if label not found
-            return field.get_attribute('placeholder') or field.get_attribute('name') or ''
+    def _form_agent(self, method, *args):
+        """Call a method on the injected form agent, installing it if the page has none"""
+        # Send only the short call; the agent source goes over the wire once per page
+        result = self.driver.execute_script(FORM_AGENT_CALL_JS.format(method=method), *args)
+        if result == FORM_AGENT_MISSING:
+            result = self.driver.execute_script(
+                FORM_AGENT_JS + f"\nreturn window.__lla.{method}(...arguments);", *args)
+        return result
+
+    def _answer_form_step(self, step):
+        """Ask the AI for every field and screening question collected from a form step"""
+        answers = {'fields': {}, 'questions': {}}
+        
+        # Submit every AI request up front so they run in parallel instead of one by one
+        field_futures = [
+            (field['idx'], self._executor.submit(
+                self.ai_assistant.get_form_field_value, field['label'], field['type'], field['options']))
+            for field in step['fields']
+        ]
+        question_futures = [
+            (question['idx'], self._executor.submit(
+                self.ai_assistant.handle_screening_question, question['text'], question['options']))
+            for question in step['questions']
+        ]
+        
+        for kind, futures in (('fields', field_futures), ('questions', question_futures)):
+            for idx, future in futures:
+                value = future.result()
+                if value and value != 'SKIP':
+                    answers[kind][str(idx)] = value
+        
+        return answers
 
     def click_next_or_submit(self):
         """Click Next or Submit button"""
         try:
-            # Look for Next or Submit button
-            button_selectors = [
-                "button[aria-label='Submit application']",
-                "button[aria-label='Continue to next step']",
-                "button[aria-label='Review your application']",
-                "button[type='submit']"
-            ]
-            
-            for selector in button_selectors:
-                try:
-                    button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if button.is_enabled():
-                        button.click()
-                        return True
-                except:
-                    continue
-            
-            return False
+            # Find and click the Next or Submit button in a single call
+            return self._cdp_click(NEXT_OR_SUBMIT_CSS)
             
         except Exception as e:
             logger.error(f"Error clicking next/submit: {str(e)}")
             return False
 
-    def check_application_completed(self):
-        """Check if application is completed"""
+    def check_application_completed(self, timeout=0):
+        """Check if application is completed; waiting up to timeout seconds, only a submit confirmation counts"""
         try:
-            success_indicators = [
-                "//div[contains(text(), 'Application submitted')]",
-                "//span[contains(text(), 'Applied')]",
-                "//h3[contains(text(), 'Application submitted')]",
-                "//span[contains(text(), 'Done')]"
-            ]
-            
-            return any(len(self.driver.find_elements(By.XPATH, indicator)) > 0 
-                      for indicator in success_indicators)
+            if timeout:
+                WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY).until(SUCCESS_CONDS)
+                return True
+            # Probing without a submit, so an existing "Applied" badge counts too
+            return len(self.driver.find_elements(By.XPATH, SUCCESS_XPATH)) > 0
             
+        except TimeoutException:
+            return False
         except Exception as e:
             logger.error(f"Error checking application completion: {str(e)}")
             return False
@@ -330,82 +491,98 @@ class LinkedInApply:
     def handle_easy_apply_process(self):
         """Handle the Easy Apply process after clicking the button"""
         try:
-            # Wait for the modal to appear and any loading to finish
-            self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div[data-test-modal-id='easy-apply-modal']")))
-            time.sleep(2)  # Wait for modal to fully load
+            # Wait for the modal to appear and watch it for step changes
+            self.wait.until(EASY_APPLY_MODAL_PRESENT)
+            self.driver.execute_script(OBSERVE_STEP_JS, EASY_APPLY_MODAL_CSS)
             
-            while True:  # Loop through all steps
+            for _ in range(MAX_FORM_STEPS):  # Loop through the steps, but never forever
                 # Wait for any loading to finish
                 self.wait_for_loading_modal()
-                time.sleep(1)  # Extra wait to ensure form is loaded
                 
-                # First try to find Submit Application button
-                try:
-                    submit_buttons = self.driver.find_elements(By.CSS_SELECTOR, 
-                        "button[aria-label='Submit application'], " + 
-                        "button[type='submit']")
-                    
-                    for button in submit_buttons:
-                        if button.is_displayed() and button.is_enabled() and (
-                            "submit" in button.text.lower() or 
-                            "submit" in button.get_attribute("aria-label").lower()):
-                            logger.info("Found Submit Application button")
-                            
-                            # Try to click the submit button
-                            try:
-                                self.driver.execute_script("arguments[0].click();", button)
-                            except:
-                                button.click()
-                            
-                            time.sleep(2)  # Wait after submit
-                            
-                            # Check for success modal
-                            try:
-                                success = self.wait.until(EC.presence_of_element_located(
-                                    (By.XPATH, "//*[contains(text(), 'application was sent')]")))
-                                if success:
-                                    logger.info("Application submitted successfully")
-                                    return True
-                            except:
-                                logger.warning("No success message found after submit")
-                            
-                            return False
+                # Locate and click Submit, or else Next, without fetching the button
+                clicked = self._click_step_button()
+                
+                if clicked == 'submit':
+                    logger.info("Clicked Submit Application button")
                     
-                except Exception as e:
-                    logger.debug(f"Submit button not found: {str(e)}")
+                    # Check for any known success message
+                    if self.check_application_completed(timeout=SUCCESS_TIMEOUT):
+                        logger.info("Application submitted successfully")
+                        return True
+                    logger.warning("No success message found after submit")
+                    return False
                 
-                # If no Submit button, look for Next button
-                try:
-                    next_buttons = self.driver.find_elements(By.CSS_SELECTOR,
-                        "button[aria-label*='Continue to next step'], " +
-                        "button[aria-label*='Next'], " +
-                        "button[type='button']")
+                if clicked == 'next':
+                    logger.info("Clicked Next button, continuing to next step")
                     
-                    for button in next_buttons:
-                        if button.is_displayed() and button.is_enabled() and (
-                            "next" in button.text.lower() or 
-                            "continue" in button.text.lower() or
-                            "next" in button.get_attribute("aria-label").lower()):
-                            
-                            logger.info("Found Next button, continuing to next step")
-                            
-                            # Try to click the next button
-                            try:
-                                self.driver.execute_script("arguments[0].click();", button)
-                            except:
-                                button.click()
-                            
-                            time.sleep(2)  # Wait after clicking next
-                            continue  # Go to next step
-                            
-                except Exception as e:
-                    logger.debug(f"Next button not found: {str(e)}")
+                    # Wait for the modal observer to see the next step; a step that does not
+                    # change (e.g. a required field failed validation) will not change on a re-click
+                    if not self._wait_for_form_step(timeout=5):
+                        logger.warning("Form step did not change after clicking Next, stopping")
+                        return False
+                    continue  # Go to next step
                 
                 # If we get here, we couldn't find either button
                 logger.warning("Could not find Submit or Next button")
                 return False
+            
+            logger.warning(f"No Submit button after {MAX_FORM_STEPS} steps, stopping")
+            return False
                 
         except Exception as e:
             logger.error(f"Error in Easy Apply process: {str(e)}")
             return False
+
+def log_in_pool(pool=browser_pool):
+    """Log in from a full browser and share its session with every pooled browser"""
+    # Pooled browsers block images, which login and CAPTCHA pages need, so log in outside the pool
+    driver = ChromeSetup().initialize_driver(headless=pool.headless)
+    if driver is None:
+        return False
+    try:
+        if not LinkedInLogin(driver).login():
+            return False
+        pool.set_login_cookies(driver.get_cookies())
+        return True
+    finally:
+        cleanup_driver(driver)
+
+async def apply_to_jobs(jobs, workers=POOL_SIZE, db_manager=None, cookies=None):
+    """Apply to many jobs concurrently, one pooled browser per worker; returns results in input order"""
+    queue = asyncio.Queue()
+    for index, job_data in enumerate(jobs):
+        queue.put_nowait((index, job_data))
+    results = [False] * len(jobs)
+    
+    # Pooled browsers start with fresh profiles and see no Easy Apply button logged out, so
+    # share the caller's session cookies, or log one browser in and share its session
+    if cookies:
+        browser_pool.set_login_cookies(cookies)
+    elif not browser_pool.has_login and not await asyncio.to_thread(log_in_pool):
+        logger.error("Could not log in to LinkedIn, not applying to any job")
+        return results
+    
+    async def worker():
+        # Each worker owns a LinkedInApply (and so a driver); the AI assistant is shared
+        applier = await asyncio.to_thread(LinkedInApply, db_manager=db_manager)
+        try:
+            while True:
+                try:
+                    index, job_data = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    if job_data.get('url'):
+                        await asyncio.to_thread(applier.driver.get, job_data['url'])
+                    # Selenium calls block, so each job runs on a worker thread
+                    results[index] = await asyncio.to_thread(applier.apply_to_job, job_data)
+                except Exception as e:
+                    logger.error(f"Error applying to {job_data.get('title')}: {str(e)}")
+        finally:
+            applier.close()
+    
+    try:
+        await asyncio.gather(*[worker() for _ in range(min(workers, len(jobs)))])
+    finally:
+        browser_pool.close_all()
+    return results
@@ -1,11 +1,13 @@
 import os
+import re
 import time
 import sys
 import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    WebDriverException, TimeoutException, StaleElementReferenceException)
 
 from config import Config
 from utils.logger import setup_logger
@@ -18,12 +20,134 @@ from linkedin_apply import LinkedInApply
 
 logger = setup_logger(__name__, "linkedin_auto_apply", level=Config.LOG_LEVEL)
 
+# Job ID in a job view URL, or in the search page's currentJobId parameter
+_JOB_ID_RE = re.compile(r'(?:jobs/view/|currentJobId=)(\d+)')
+
+# Case-insensitive "remote" check for titles and locations, without lowercased copies
+_REMOTE_SEARCH = re.compile(r'remote', re.I).search
+
+def job_id_from_url(url):
+    """Extract the numeric LinkedIn job ID from a URL, or None if it has none"""
+    match = _JOB_ID_RE.search(url or '')
+    return match.group(1) if match else None
+
+# Search results and the fields read from each job card
+JOB_LISTINGS_CSS = ".jobs-search-results__list"
+JOB_CARD_CSS = ".job-card-container"
+JOB_CARD_TITLE_CSS = ".job-card-list__title"
+JOB_CARD_COMPANY_CSS = ".job-card-container__company-name"
+
+# Places a job card shows its "Applied" status, as one CSS union
+APPLIED_STATUS_CSS = ", ".join([
+    ".job-card-container__footer-item",
+    ".artdeco-entity-lockup__subtitle",
+    ".job-card-list__footer-wrapper",
+    ".jobs-applied-badge"
+])
+
+# Job details pane
+EMPLOYER_NAME_CSS = "[data-test-employer-name]"
+JOB_TITLE_CSS = "[data-test-job-title]"
+
+# Page URL, employer name and job title of the open job as [url, employer, title]
+JOB_IDENTITY_JS = """
+const text = css => document.querySelector(css)?.innerText.trim() ?? null;
+return [location.href, text(arguments[0]), text(arguments[1])];
+"""
+
+# Easy Apply button variants, as one CSS union
+EASY_APPLY_BUTTON_CSS = ", ".join([
+    "button.jobs-apply-button[aria-label*='Easy Apply']",
+    "button[aria-label*='Easy Apply']",
+    ".jobs-apply-button",
+    "[data-control-name='jobdetails_topcard_inapply']"
+])
+APPLY_BUTTON_CSS = ".jobs-apply-button"
+
+# Easy Apply modal and its buttons
+EASY_APPLY_MODAL_CSS = "div[data-test-modal-id='easy-apply-modal']"
+SUBMIT_BUTTON_CSS = "footer button[aria-label='Submit application']"
+NEXT_BUTTON_CSS = "footer button[aria-label='Continue to next step']"
+DISMISS_BUTTON_CSS = "button[aria-label='Dismiss']"
+APPLICATION_SENT_XPATH = "//*[contains(text(), 'Your application was sent to')]"
+
+# Clicks the enabled Submit button, or else the enabled Next button, and reports which
+CLICK_STEP_BUTTON_JS = """
+const enabled = css => [...document.querySelectorAll(css)].find(b => !b.disabled && b.offsetParent);
+const submit = enabled(arguments[0]);
+const button = submit || enabled(arguments[1]);
+if (!button) return null;
+button.click();
+return submit ? 'submit' : 'next';
+"""
+
+# Any element that only appears once logged in, as one CSS union
+LOGGED_IN_CSS = ", ".join([
+    ".global-nav",
+    "[data-control-name='feed_nav_home']",
+    ".feed-identity-module",
+    ".search-global-typeahead__input"
+])
+
+# Common loading modal selectors in LinkedIn, as one CSS union
+LOADING_SELECTORS = ", ".join([
+    "div.artdeco-loader",
+    "div.artdeco-modal__loader",
+    "div.loading-icon",
+    "div.loading-animation",
+    "div[role='progressbar']",
+    "div.artdeco-spinner",
+    ".artdeco-modal__loading"
+])
+
+# Optional fields of the job details pane, read in one call; missing ones come back null
+JOB_DETAILS_JS = """
+const text = css => document.querySelector(css)?.innerText ?? null;
+return {
+    description: text('.job-description'),
+    companyUrl: document.querySelector("a[data-tracking-control-name='public_jobs_company-name']")?.href ?? null,
+    location: text('.job-details-jobs-unified-top-card__bullet'),
+    salary: text('.compensation__salary'),
+    applicants: text('.num-applicants__caption')
+};
+"""
+
+# Job cards processed between commits of the apply_to_jobs transaction
+SWEEP_COMMIT_INTERVAL = 10
+
+# Describes every form field on the page in one call as [type, label, options, required]
+COLLECT_FORM_FIELDS_JS = """
+const labelOf = el => {
+    const forLabel = el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null;
+    const label = (forLabel || el.closest('label'))?.innerText.trim();
+    return label || el.getAttribute('aria-label') || el.name || 'Unknown Field';
+};
+const fields = [];
+for (const el of document.querySelectorAll("input:not([type='hidden'])")) {
+    fields.push([el.type, labelOf(el), null, el.required]);
+}
+for (const el of document.querySelectorAll('select')) {
+    fields.push(['select', labelOf(el), [...el.options].map(o => o.text), el.required]);
+}
+for (const el of document.querySelectorAll('textarea')) {
+    fields.push(['textarea', labelOf(el), null, el.required]);
+}
+for (const group of document.querySelectorAll('fieldset')) {
+    const legend = group.querySelector('legend');
+    if (!legend) continue;
+    const radios = [...group.querySelectorAll("input[type='radio']")].map(r => r.value);
+    fields.push(['radio', legend.innerText.trim(), radios, false]);
+}
+return fields;
+"""
+
 class LinkedInAutoApply:
     def __init__(self):
         """Initialize the LinkedIn Auto Apply Bot"""
         self.driver = ChromeSetup().initialize_driver(headless=Config.BROWSER_HEADLESS)
         if not self.driver:
             raise Exception("Failed to initialize Chrome driver")
+        self.wait = WebDriverWait(self.driver, Config.BROWSER_TIMEOUT, poll_frequency=0.1)
         
         # Get parameters from config
         self.keywords = Config.JOB_SEARCH_KEYWORDS
@@ -35,6 +159,14 @@ class LinkedInAutoApply:
         
         logger.info(f"Initialized with keywords='{self.keywords}', location='{self.location}', max_jobs={self.max_jobs}")
         logger.info(f"Running in {Config.ENV} mode")
+        
+        # Opened by run() and closed when it finishes
+        self.db = None
+        
+        # Form fields collected on the current page, saved together by save_form_fields
+        self._pending_fields = []
+        # Job IDs already applied to, filled by load_applied_jobs
+        self.applied_jobs = set()
 
     def get_database_stats(self):
         """Get statistics about the database"""
@@ -53,14 +185,9 @@ Database Statistics:
             logger.error(f"Error getting database stats: {str(e)}")
 
     def load_applied_jobs(self):
-        """Load already applied jobs from database"""
+        """Load already applied job IDs from database with a single query"""
         try:
-            # Initialize the set
-            self.applied_jobs = set()
-            
-            # Get all job IDs with status 'APPLIED'
-            self.applied_jobs = self.db.get_applied_jobs()
-            
+            self.applied_jobs = self.db.get_applied_job_ids()
             logger.info(f"Loaded {len(self.applied_jobs)} previously applied jobs")
             
         except Exception as e:
@@ -71,20 +198,12 @@ Database Statistics:
         """Check if we've already applied to this job"""
         try:
             # Extract job ID from URL
-            job_id = job_url.split('jobs/view/')[-1].split('?')[0]
+            job_id = job_id_from_url(job_url)
             
-            # First check memory cache
+            # The set holds every applied job loaded at start plus those applied to since
             if job_id in self.applied_jobs:
-                logger.info(f"Already applied to job {job_id} (found in memory)")
+                logger.info(f"Already applied to job {job_id}")
                 return True
-            
-            # Then check database
-            if self.db.is_job_applied(job_id):
-                # Add to memory cache
-                self.applied_jobs.add(job_id)
-                logger.info(f"Already applied to job {job_id} (found in database)")
-                return True
-                
             return False
             
         except Exception as e:
@@ -102,10 +221,9 @@ Database Statistics:
             applications_submitted = 0
             
             # Wait for job listings to be visible
-            job_listings_selector = ".jobs-search-results__list"
             try:
                 job_listings = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, job_listings_selector))
+                    EC.presence_of_element_located((By.CSS_SELECTOR, JOB_LISTINGS_CSS))
                 )
                 logger.info("Found job listings container")
             except TimeoutException:
@@ -113,61 +231,72 @@ Database Statistics:
                 return False
             
             # Get all job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-card-container")
+            job_cards = self.driver.find_elements(By.CSS_SELECTOR, JOB_CARD_CSS)
             if not job_cards:
                 logger.warning("No job cards found")
                 return False
             
             logger.info(f"Found {len(job_cards)} job cards")
             
-            for index, job_card in enumerate(job_cards):
-                if applications_submitted >= max_applications:
-                    logger.info(f"Reached maximum applications limit ({max_applications})")
-                    break
-                
-                try:
-                    # Check if already applied
-                    if self.check_job_status(job_card):
-                        logger.info("Already applied to this job, skipping")
-                        continue
-                    
-                    # Click on job card
-                    self.driver.execute_script("arguments[0].click();", job_card)
-                    time.sleep(2)  # Wait for job details to load
-                    
-                    # Get job details
-                    job_title = job_card.find_element(By.CSS_SELECTOR, ".job-card-list__title").text
-                    company_name = job_card.find_element(By.CSS_SELECTOR, ".job-card-container__company-name").text
-                    
-                    logger.info(f"Processing job: {job_title} at {company_name}")
+            # Every database write of the sweep shares one transaction
+            with self.db.transaction():
+                for index, job_card in enumerate(job_cards):
+                    if applications_submitted >= max_applications:
+                        logger.info(f"Reached maximum applications limit ({max_applications})")
+                        break
                     
-                    # Check for Easy Apply button
-                    easy_apply_button = self.check_easy_apply_button()
-                    if not easy_apply_button:
-                        logger.info("No Easy Apply button found, skipping")
-                        continue
+                    # Bound what a crash could lose without committing per write
+                    if index and index % SWEEP_COMMIT_INTERVAL == 0:
+                        self.db.commit()
                     
-                    # Click Easy Apply and process application
                     try:
-                        self.driver.execute_script("arguments[0].click();", easy_apply_button)
-                        time.sleep(2)  # Wait for application modal
+                        # Check if already applied
+                        if self.check_job_status(job_card):
+                            logger.info("Already applied to this job, skipping")
+                            continue
+                        
+                        # Get job details
+                        job_title = job_card.find_element(By.CSS_SELECTOR, JOB_CARD_TITLE_CSS).text
+                        
+                        # Click on job card and wait for its details instead of a fixed delay
+                        previous_titles = self.driver.find_elements(By.CSS_SELECTOR, JOB_TITLE_CSS)
+                        self.driver.execute_script("arguments[0].click();", job_card)
+                        if not self._wait_for_details_pane(
+                                previous_titles[0] if previous_titles else None, job_title):
+                            logger.warning("Details pane still shows the previous job, skipping")
+                            continue
+                        
+                        company_name = job_card.find_element(By.CSS_SELECTOR, JOB_CARD_COMPANY_CSS).text
+                        
+                        logger.info(f"Processing job: {job_title} at {company_name}")
+                        
+                        # Check for Easy Apply button
+                        easy_apply_button = self.check_easy_apply_button()
+                        if not easy_apply_button:
+                            logger.info("No Easy Apply button found, skipping")
+                            continue
                         
-                        if self.handle_easy_apply_process():
-                            applications_submitted += 1
-                            logger.info(f"Successfully applied to job ({applications_submitted}/{max_applications})")
-                        else:
-                            logger.warning("Failed to complete application, moving to next job")
+                        # Click Easy Apply and process application
+                        try:
+                            # handle_easy_apply_process waits for the modal itself
+                            self.driver.execute_script("arguments[0].click();", easy_apply_button)
+                            
+                            if self.handle_easy_apply_process():
+                                applications_submitted += 1
+                                logger.info(f"Successfully applied to job ({applications_submitted}/{max_applications})")
+                            else:
+                                logger.warning("Failed to complete application, moving to next job")
+                            
+                        except Exception as e:
+                            logger.error(f"Error in application process: {str(e)}")
+                            continue
                         
                     except Exception as e:
-                        logger.error(f"Error in application process: {str(e)}")
+                        logger.error(f"Error processing job card {index}: {str(e)}")
                         continue
                     
-                except Exception as e:
-                    logger.error(f"Error processing job card {index}: {str(e)}")
-                    continue
+                    time.sleep(2)  # Wait between applications
                 
-                time.sleep(2)  # Wait between applications
-            
             logger.info(f"Completed job applications. Submitted {applications_submitted} applications")
             return True
             
@@ -178,38 +307,22 @@ Database Statistics:
     def save_job_details(self, job_id, company_name, job_title, job_url, status="PENDING", failure_reason=None):
         """Save job application details to database"""
         try:
-            # Get additional job details if available
-            try:
-                job_description = self.driver.find_element(By.CSS_SELECTOR, ".job-description").text
-            except:
-                job_description = None
-                
-            try:
-                company_url = self.driver.find_element(By.CSS_SELECTOR, "a[data-tracking-control-name='public_jobs_company-name']").get_attribute("href")
-            except:
-                company_url = None
-                
-            try:
-                job_location = self.driver.find_element(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__bullet").text
-            except:
-                job_location = None
-                
-            try:
-                salary_range = self.driver.find_element(By.CSS_SELECTOR, ".compensation__salary").text
-            except:
-                salary_range = None
-                
-            try:
-                num_applicants = self.driver.find_element(By.CSS_SELECTOR, ".num-applicants__caption").text
-                num_applicants = int(''.join(filter(str.isdigit, num_applicants)))
-            except:
-                num_applicants = None
-                
-            try:
-                is_remote = "remote" in job_title.lower() or "remote" in job_location.lower() if job_location else False
-            except:
-                is_remote = False
+            # Get additional job details if available, all read in one round-trip
+            details = self.driver.execute_script(JOB_DETAILS_JS) or {}
+            job_description = details.get('description')
+            company_url = details.get('companyUrl')
+            job_location = details.get('location')
+            salary_range = details.get('salary')
+            
+            applicants_digits = ''.join(filter(str.isdigit, details.get('applicants') or ''))
+            num_applicants = int(applicants_digits) if applicants_digits else None
+            
+            is_remote = bool(_REMOTE_SEARCH(job_title or '') or _REMOTE_SEARCH(job_location or ''))
                 
+            # Keep the in-memory applied set current so is_already_applied never needs the database
+            if status == "APPLIED":
+                self.applied_jobs.add(job_id)
+            
             # Insert or update job details
             self.db.save_job_details(job_id, company_name, job_title, job_description, job_location, salary_range, job_url, num_applicants, is_remote, status, failure_reason)
             
@@ -230,41 +343,58 @@ Database Statistics:
             logger.error(f"Error logging application attempt: {str(e)}")
             logger.warning("Continuing without logging to database")
 
-    def save_form_field(self, job_id, field_type, field_label, field_options=None, is_required=False):
-        """Save form field to database"""
+    def _queue_form_field(self, job_id, field_type, field_label, field_options=None, is_required=False):
+        """Queue a form field to be saved with the rest of the page's fields"""
+        self._pending_fields.append((job_id, field_type, field_label, field_options, is_required))
+
+    def save_form_fields(self):
+        """Save all queued form fields to database in one transaction"""
         try:
-            self.db.save_form_field(job_id, field_type, field_label, field_options, is_required)
-            logger.info(f"Saved form field: {field_label}")
+            if self._pending_fields:
+                self.db.save_form_fields(self._pending_fields)
+                logger.info(f"Saved {len(self._pending_fields)} form fields")
         except Exception as e:
-            logger.error(f"Error saving form field: {str(e)}")
-            logger.warning("Continuing without saving form field")
+            logger.error(f"Error saving form fields: {str(e)}")
+            logger.warning("Continuing without saving form fields")
+        finally:
+            self._pending_fields = []
+
+    def _wait_for_details_pane(self, previous_title, job_title, timeout=5):
+        """Wait for the details pane to swap out previous_title for the clicked job.
+        
+        The pane is ready once the title element from before the click has gone
+        stale or the pane title reads the same as the clicked card's title.
+        """
+        def pane_switched(driver):
+            titles = driver.find_elements(By.CSS_SELECTOR, JOB_TITLE_CSS)
+            if not titles:
+                return False
+            if previous_title is None or EC.staleness_of(previous_title)(driver):
+                return True
+            try:
+                return titles[0].text.strip() == job_title.strip()
+            except StaleElementReferenceException:
+                return False
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(pane_switched)
+            return True
+        except TimeoutException:
+            logger.warning("Job details did not load in time")
+            return False
+
+    @staticmethod
+    def _loading_visible(driver):
+        """Whether any loading indicator is currently displayed"""
+        return any(element.is_displayed() for element in driver.find_elements(By.CSS_SELECTOR, LOADING_SELECTORS))
 
     def wait_for_loading_modal(self):
         """Wait for any loading modals to disappear"""
         try:
-            # Common loading modal selectors in LinkedIn
-            loading_selectors = [
-                "div.artdeco-loader", 
-                "div.artdeco-modal__loader",
-                "div.loading-icon",
-                "div.loading-animation",
-                "div[role='progressbar']",
-                "div.artdeco-spinner",
-                ".artdeco-modal__loading"
-            ]
-            
-            # Wait for any loading indicators to disappear
-            for selector in loading_selectors:
-                try:
-                    loading_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if loading_element.is_displayed():
-                        logger.info(f"Waiting for loading modal {selector} to resolve")
-                        self.wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, selector)))
-                except NoSuchElementException:
-                    continue
-                
-            # Additional wait to ensure content is loaded
-            time.sleep(1)
+            # Wait for any loading indicators to disappear, all found with one query
+            if self._loading_visible(self.driver):
+                logger.info("Waiting for loading modal to resolve")
+                self.wait.until_not(self._loading_visible)
             return True
             
         except Exception as e:
@@ -274,18 +404,17 @@ Database Statistics:
     def handle_easy_apply_process(self):
         """Handle the Easy Apply process after clicking the button"""
         try:
-            # Get job details
-            job_id = self.driver.current_url.split('jobs/view/')[-1].split('?')[0]
-            company_name = self.driver.find_element(By.CSS_SELECTOR, "[data-test-employer-name]").text
-            job_title = self.driver.find_element(By.CSS_SELECTOR, "[data-test-job-title]").text
-            job_url = self.driver.current_url
+            # Get job details in one round-trip
+            job_url, company_name, job_title = self.driver.execute_script(
+                JOB_IDENTITY_JS, EMPLOYER_NAME_CSS, JOB_TITLE_CSS)
+            job_id = job_id_from_url(job_url)
             
             # Save initial job details
             self.save_job_details(job_id, company_name, job_title, job_url)
             
             # Wait for the modal to appear and any loading to finish
             self.wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div[data-test-modal-id='easy-apply-modal']")))
+                (By.CSS_SELECTOR, EASY_APPLY_MODAL_CSS)))
             self.wait_for_loading_modal()
             
             while True:  # Loop through all steps
@@ -301,36 +430,27 @@ Database Statistics:
                 # Collect form fields on current page
                 self.collect_form_fields(job_id)
                 
-                # First try to find Submit Application button
+                # Wait once for whichever of Submit or Next becomes clickable, and click it in the page
                 try:
-                    submit_button = self.wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "footer button[aria-label='Submit application']")))
-                    logger.info("Found Submit Application button")
-                    self.driver.execute_script("arguments[0].click();", submit_button)
-                    
-                    # Wait for loading after submit
-                    self.wait_for_loading_modal()
+                    clicked = self.wait.until(
+                        lambda d: d.execute_script(CLICK_STEP_BUTTON_JS, SUBMIT_BUTTON_CSS, NEXT_BUTTON_CSS))
+                except TimeoutException:
+                    logger.warning("Could not find Submit or Next button")
+                    return False
+                
+                # Wait for loading after the click
+                self.wait_for_loading_modal()
+                
+                if clicked == 'submit':
+                    logger.info("Clicked Submit Application button")
                     
                     # Check for success modal
                     if self.check_for_sent_modal():
                         # Update job status to APPLIED
                         self.save_job_details(job_id, company_name, job_title, job_url, "APPLIED")
                         return True
-                    
-                except TimeoutException:
-                    # If no Submit button, look for Next button
-                    try:
-                        next_button = self.wait.until(EC.element_to_be_clickable(
-                            (By.CSS_SELECTOR, "footer button[aria-label='Continue to next step']")))
-                        logger.info("Found Next button, continuing to next step")
-                        self.driver.execute_script("arguments[0].click();", next_button)
-                        
-                        # Wait for loading after clicking next
-                        self.wait_for_loading_modal()
-                        continue  # Go to next step
-                    except TimeoutException:
-                        logger.warning("Could not find Submit or Next button")
-                        return False
+                else:
+                    logger.info("Clicked Next button, continuing to next step")
                 
         except Exception as e:
             logger.error(f"Error in Easy Apply process: {str(e)}")
@@ -344,7 +464,7 @@ Database Statistics:
             
             # Look for the success message text
             success_message = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//*[contains(text(), 'Your application was sent to')]")))
+                (By.XPATH, APPLICATION_SENT_XPATH)))
             
             if success_message:
                 logger.info("Application submitted successfully")
@@ -352,7 +472,7 @@ Database Statistics:
                 # Look for and click "Not now" or "Done" button if present
                 try:
                     done_button = self.wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, "button[aria-label='Dismiss']")))
+                        (By.CSS_SELECTOR, DISMISS_BUTTON_CSS)))
                     self.driver.execute_script("arguments[0].click();", done_button)
                     logger.info("Clicked dismiss button")
                     
@@ -373,57 +493,16 @@ Database Statistics:
     def collect_form_fields(self, job_id):
         """Collect all form fields on current page"""
         try:
-            # Look for input fields
-            input_fields = self.driver.find_elements(By.CSS_SELECTOR, "input:not([type='hidden'])")
-            for field in input_fields:
-                field_type = field.get_attribute("type")
-                field_label = self.get_field_label(field)
-                is_required = field.get_attribute("required") == "true"
-                self.save_form_field(job_id, field_type, field_label, is_required=is_required)
-            
-            # Look for select fields
-            select_fields = self.driver.find_elements(By.TAG_NAME, "select")
-            for field in select_fields:
-                options = [opt.text for opt in field.find_elements(By.TAG_NAME, "option")]
-                field_label = self.get_field_label(field)
-                is_required = field.get_attribute("required") == "true"
-                self.save_form_field(job_id, "select", field_label, options, is_required)
-            
-            # Look for textareas
-            textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-            for field in textareas:
-                field_label = self.get_field_label(field)
-                is_required = field.get_attribute("required") == "true"
-                self.save_form_field(job_id, "textarea", field_label, is_required=is_required)
-            
-            # Look for radio button groups
-            radio_groups = self.driver.find_elements(By.CSS_SELECTOR, "fieldset")
-            for group in radio_groups:
-                try:
-                    legend = group.find_element(By.TAG_NAME, "legend").text
-                    options = [opt.get_attribute("value") for opt in group.find_elements(By.CSS_SELECTOR, "input[type='radio']")]
-                    self.save_form_field(job_id, "radio", legend, options)
-                except:
-                    continue
+            # Read every field's type, label, options and required flag in one round-trip
+            fields = self.driver.execute_script(COLLECT_FORM_FIELDS_JS) or []
+            for field_type, field_label, options, is_required in fields:
+                self._queue_form_field(job_id, field_type, field_label, options, is_required)
             
         except Exception as e:
             logger.error(f"Error collecting form fields: {str(e)}")
-
-    def get_field_label(self, field):
-        """Get label text for a form field"""
-        try:
-            # Try to find label by for attribute
-            field_id = field.get_attribute("id")
-            if field_id:
-                label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{field_id}']")
-                return label.text
-            
-            # Try to find label as parent or ancestor
-            parent = field.find_element(By.XPATH, "./ancestor::label")
-            return parent.text
-        except:
-            # If no label found, try to get aria-label or name
-            return field.get_attribute("aria-label") or field.get_attribute("name") or "Unknown Field"
+        
+        # Whatever was collected goes to the database in one batch
+        self.save_form_fields()
 
     def handle_security_check(self):
         """Handle security check if encountered"""
@@ -495,18 +574,10 @@ Database Statistics:
     def check_if_logged_in(self):
         """Check if we are already logged in"""
         try:
-            # Check for successful login indicators
-            success_indicators = [
-                ".global-nav",
-                "[data-control-name='feed_nav_home']",
-                ".feed-identity-module",
-                ".search-global-typeahead__input"
-            ]
-            
-            for selector in success_indicators:
-                if self.wait_for_element(By.CSS_SELECTOR, selector, timeout=5):
-                    logger.info("Already logged in")
-                    return True
+            # Wait once for any of the login indicators
+            if self.wait_for_element(By.CSS_SELECTOR, LOGGED_IN_CSS, timeout=5):
+                logger.info("Already logged in")
+                return True
             
             return False
             
@@ -525,6 +596,7 @@ Database Statistics:
             self.login = LinkedInLogin(self.driver)
             self.jobs = LinkedInJobs(self.driver)
             self.db = DatabaseManager()
+            self.load_applied_jobs()
             
             # Start from login page
             check_browser_open(self.driver)
@@ -554,11 +626,14 @@ Database Statistics:
             
         finally:
             cleanup_driver(self.driver)
+            if self.db:
+                self.db.close()
 
     def wait_for_element(self, by, selector, timeout=10):
         """Wait for an element to be present"""
         try:
-            self.wait.until(EC.presence_of_element_located((by, selector)))
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((by, selector)))
             return True
         except TimeoutException:
             return False
@@ -566,22 +641,13 @@ Database Statistics:
     def check_easy_apply_button(self):
         """Check if Easy Apply button is present and clickable"""
         try:
-            # Check for Easy Apply button with various selectors
-            button_selectors = [
-                "button.jobs-apply-button[aria-label*='Easy Apply']",
-                "button[aria-label*='Easy Apply']",
-                ".jobs-apply-button",
-                "[data-control-name='jobdetails_topcard_inapply']"
-            ]
-            
-            for selector in button_selectors:
-                buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for button in buttons:
-                    if button.is_displayed() and "Easy Apply" in button.get_attribute("innerHTML"):
-                        return button
+            # Check for Easy Apply button with all selectors in one query
+            for button in self.driver.find_elements(By.CSS_SELECTOR, EASY_APPLY_BUTTON_CSS):
+                if button.is_displayed() and "Easy Apply" in button.get_attribute("innerHTML"):
+                    return button
             
             # If no Easy Apply button found, log the reason
-            apply_buttons = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-apply-button")
+            apply_buttons = self.driver.find_elements(By.CSS_SELECTOR, APPLY_BUTTON_CSS)
             if apply_buttons:
                 for button in apply_buttons:
                     logger.info(f"Found non-Easy Apply button: {button.get_attribute('innerHTML')}")
@@ -597,20 +663,11 @@ Database Statistics:
     def check_job_status(self, job_card):
         """Check if job has already been applied to"""
         try:
-            # Check for "Applied" status in various locations
-            status_selectors = [
-                ".job-card-container__footer-item",
-                ".artdeco-entity-lockup__subtitle",
-                ".job-card-list__footer-wrapper",
-                ".jobs-applied-badge"
-            ]
-            
-            for selector in status_selectors:
-                elements = job_card.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    if "Applied" in element.text:
-                        logger.info("Found 'Applied' status on job card")
-                        return True
+            # Check for "Applied" status in all known locations with one query
+            for element in job_card.find_elements(By.CSS_SELECTOR, APPLIED_STATUS_CSS):
+                if "Applied" in element.text:
+                    logger.info("Found 'Applied' status on job card")
+                    return True
             return False
             
         except Exception as e:
@@ -1,20 +1,133 @@
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import cv2
-import numpy as np
-from PIL import Image
-import base64
-import io
+from selenium.common.exceptions import WebDriverException, TimeoutException
 import time
 
 logger = logging.getLogger(__name__)
 
+# Smallest natural width and height, in pixels, of an image treated as a puzzle tile
+MIN_TILE_SIZE = 80
+
+# Visible inline images of at least the size passed in, as [element, base64 payload] pairs, in one call
+VISIBLE_DATA_IMAGES_JS = """
+return [...document.images]
+    .filter(img => img.offsetParent && img.src.startsWith('data:image') &&
+                   img.naturalWidth >= arguments[0] && img.naturalHeight >= arguments[0])
+    .map(img => [img, img.src.slice(img.src.indexOf(',') + 1)]);
+"""
+
+# Any element that only appears on a normal LinkedIn page
+NORMAL_PAGE_XPATH = " | ".join([
+    "//div[contains(@class, 'jobs-search-box')]",
+    "//header[contains(@class, 'global-nav')]",
+    "//div[contains(@class, 'jobs-search-results')]",
+    "//div[contains(@class, 'jobs-search-two-pane')]"
+])
+
+# Any element that shows verification is still in progress
+VERIFICATION_XPATH = " | ".join([
+    "//iframe",
+    "//div[contains(text(), 'verification')]",
+    "//div[contains(text(), 'security check')]",
+    "//button[contains(text(), 'Verify')]"
+])
+
+# [normal page showing, verification still showing] for the two XPaths passed in, in one call
+VERIFICATION_STATE_JS = """
+const found = xpath => document.evaluate(xpath, document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+return [found(arguments[0]), found(arguments[1])];
+"""
+
+# Any verification text that marks the current iframe as the security check
+VERIFICATION_TEXT_XPATH = " | ".join([
+    "//h1[contains(text(), 'Verification')]",
+    "//div[contains(text(), 'Please solve this puzzle')]",
+    "//div[contains(text(), 'security check')]"
+])
+
+# Puzzle instruction text and the button that submits the puzzle
+INSTRUCTION_XPATH = "//div[contains(text(), 'Pick the image') or contains(text(), 'Select the image')]"
+VERIFY_BUTTON_XPATH = "//button[text()='Verify']"
+
+# [is verification frame, visible Verify button or null, image count] for the current frame, in one call
+VERIFICATION_FRAME_JS = """
+const isVerification = document.evaluate(arguments[0], document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+if (!isVerification) return [false, null, 0];
+const button = [...document.querySelectorAll('button')]
+    .find(b => b.offsetParent && b.innerText.trim().toLowerCase() === 'verify');
+return [true, button || null, document.images.length];
+"""
+
+# Seconds between verification-state polls while waiting for the user
+VERIFICATION_POLL_FREQUENCY = 0.5
+
+# Side in pixels that CAPTCHA tiles are shrunk to before orientation detection
+ORIENTATION_SIZE = 64
+
+# OpenCV module, imported and checked on the first CAPTCHA
+_cv2 = None
+_cv2_lock = threading.Lock()
+
+def _opencv():
+    """Import OpenCV once, with its SIMD code paths on and AVX2 dispatch checked"""
+    global _cv2
+    with _cv2_lock:
+        if _cv2 is None:
+            _cv2 = _load_opencv()
+    return _cv2
+
+def _load_opencv():
+    """Import OpenCV and run the one-time setup for _opencv"""
+    import cv2
+    cv2.setUseOptimized(True)
+    
+    # Tiles are at most 64x64 and connected components are CPU-only in OpenCV, so a GPU
+    # round-trip costs more than it saves; turning OpenCL off also skips probing for a device
+    cv2.ocl.setUseOpenCL(False)
+    
+    # Built-in features are listed bare, runtime-dispatched ones with a * prefix
+    features = cv2.getCPUFeaturesLine()
+    if cv2.checkHardwareSupport(cv2.CPU_AVX2) and 'AVX2' not in features:
+        logger.warning("CPU supports AVX2 but this OpenCV build does not use it; "
+                       "install an opencv-python-headless build with CPU_DISPATCH including AVX2")
+    logger.debug(f"OpenCV {cv2.__version__} CPU features: {features}")
+    return cv2
+
+def _preload_opencv():
+    """Load OpenCV ahead of a puzzle, from a background thread"""
+    try:
+        _opencv()
+    except Exception as e:
+        logger.warning(f"Could not preload OpenCV: {str(e)}")
+
 class LinkedInCaptcha:
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
+        self._pool = None
+        self._scratch = threading.local()
+
+    def _classify_pool(self):
+        """Thread pool for tile classification, kept so its threads' scratch buffers are reused"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self._pool
+
+    def _scratch_buffers(self):
+        """This thread's (resized tile, mask) buffers, allocated on its first tile"""
+        buffers = getattr(self._scratch, 'buffers', None)
+        if buffers is None:
+            import numpy as np
+            shape = (ORIENTATION_SIZE, ORIENTATION_SIZE)
+            buffers = self._scratch.buffers = (np.empty(shape, np.uint8), np.empty(shape, np.uint8))
+        return buffers
 
     def check_for_security_verification(self):
         """Check and handle LinkedIn security verification"""
@@ -32,45 +145,25 @@ class LinkedInCaptcha:
                     self.driver.switch_to.frame(iframe)
                     logger.info("Switched to iframe")
                     
-                    # First look for verification text to confirm we're in the right iframe
-                    verification_texts = [
-                        "//h1[contains(text(), 'Verification')]",
-                        "//div[contains(text(), 'Please solve this puzzle')]",
-                        "//div[contains(text(), 'security check')]"
-                    ]
+                    # Verification text, the verify button and the image count, in one round-trip
+                    is_verification, verify_button, image_count = self.driver.execute_script(
+                        VERIFICATION_FRAME_JS, VERIFICATION_TEXT_XPATH)
                     
-                    if not any(len(self.driver.find_elements(By.XPATH, text)) > 0 for text in verification_texts):
+                    if not is_verification:
                         logger.debug("Not a verification iframe, skipping")
                         continue
                         
                     logger.info("Found verification iframe")
                     
-                    # Look for the verify button
-                    verify_selectors = [
-                        "//button[text()='Verify']",
-                        "//button[contains(text(), 'Verify')]",
-                        "//button[@type='submit']"
-                    ]
-                    
-                    verify_button = None
-                    for selector in verify_selectors:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, selector)
-                            for element in elements:
-                                if element.is_displayed() and element.text.strip().lower() == "verify":
-                                    verify_button = element
-                                    break
-                            if verify_button:
-                                break
-                        except:
-                            continue
+                    # Load OpenCV in the background while the puzzle instruction is read,
+                    # so a puzzle does not pay the import on its first tile
+                    threading.Thread(target=_preload_opencv, daemon=True).start()
                     
                     if verify_button:
                         logger.info("Found verify button")
                         
                         # Check for puzzle elements before clicking
-                        puzzle_images = self.driver.find_elements(By.TAG_NAME, "img")
-                        if len(puzzle_images) > 1:  # More than one image indicates a puzzle
+                        if image_count > 1:  # More than one image indicates a puzzle
                             logger.info("Found puzzle images, attempting to solve")
                             # Process puzzle images with OpenCV
                             if self.solve_orientation_captcha():
@@ -117,13 +210,14 @@ class LinkedInCaptcha:
 
     def solve_orientation_captcha(self):
         """Attempt to solve orientation-based image CAPTCHAs"""
+        # Image libraries load only when a CAPTCHA actually shows up
+        import base64
+        import numpy as np
+        cv2 = _opencv()
+        
         try:
-            # Get all images in the current iframe context
-            image_elements = self.driver.find_elements(By.TAG_NAME, "img")
-            
             # Get the instruction text
-            instruction_elements = self.driver.find_elements(By.XPATH, 
-                "//div[contains(text(), 'Pick the image') or contains(text(), 'Select the image')]")
+            instruction_elements = self.driver.find_elements(By.XPATH, INSTRUCTION_XPATH)
             
             if instruction_elements:
                 instruction = instruction_elements[0].text.lower()
@@ -132,27 +226,30 @@ class LinkedInCaptcha:
                 logger.warning("Could not find instruction text")
                 return False
             
-            # Process each image
-            for idx, img_element in enumerate(image_elements):
+            # Get every displayed inline image big enough to be a tile, at once; icons and logos are skipped
+            images = self.driver.execute_script(VISIBLE_DATA_IMAGES_JS, MIN_TILE_SIZE) or []
+            
+            # Decode every tile up front, straight to grayscale since only luma is used
+            tiles = []
+            for idx, (img_element, img_b64) in enumerate(images):
+                try:
+                    img_data = base64.b64decode(img_b64)
+                    gray = cv2.imdecode(np.frombuffer(img_data, np.uint8), cv2.IMREAD_GRAYSCALE)
+                    if gray is not None:
+                        tiles.append((idx, img_element, gray))
+                except Exception as e:
+                    logger.error(f"Error decoding image {idx}: {str(e)}")
+            
+            # Tiles are independent and OpenCV releases the GIL, so classify them in parallel.
+            # OpenCV's own threading is turned off so the pool does not oversubscribe the cores
+            orientations = []
+            if tiles:
+                cv2.setNumThreads(1)
+                orientations = list(self._classify_pool().map(self.detect_orientation, [tile[2] for tile in tiles]))
+            
+            # Then click the tiles that match, in page order
+            for (idx, img_element, _), orientation in zip(tiles, orientations):
                 try:
-                    # Skip if not displayed
-                    if not img_element.is_displayed():
-                        continue
-                        
-                    # Get image source
-                    img_src = img_element.get_attribute('src')
-                    if not img_src or not img_src.startswith('data:image'):
-                        continue
-                        
-                    # Convert base64 to image
-                    img_data = base64.b64decode(img_src.split(',')[1])
-                    img = Image.open(io.BytesIO(img_data))
-                    
-                    # Convert to OpenCV format
-                    cv_img = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-                    
-                    # Detect orientation using image processing
-                    orientation = self.detect_orientation(cv_img)
                     logger.info(f"Image {idx} orientation: {orientation}")
                     
                     # Check if this image matches the instruction
@@ -166,7 +263,7 @@ class LinkedInCaptcha:
                     continue
             
             # After processing all images, click verify
-            verify_button = self.driver.find_element(By.XPATH, "//button[text()='Verify']")
+            verify_button = self.driver.find_element(By.XPATH, VERIFY_BUTTON_XPATH)
             verify_button.click()
             time.sleep(2)
             
@@ -181,40 +278,33 @@ class LinkedInCaptcha:
             logger.error(f"Error solving orientation CAPTCHA: {str(e)}")
             return False
 
-    def detect_orientation(self, img):
-        """Detect image orientation using OpenCV"""
+    def detect_orientation(self, gray):
+        """Detect grayscale image orientation from the vertical centroid of its largest dark shape"""
+        cv2 = _opencv()
+        
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Resize and threshold write into this thread's buffers instead of fresh arrays
+            small, mask = self._scratch_buffers()
             
-            # Edge detection
-            edges = cv2.Canny(gray, 50, 150)
+            # A coarse up/down call needs few pixels; INTER_AREA averages rather than skips them
+            if gray.shape[0] > ORIENTATION_SIZE or gray.shape[1] > ORIENTATION_SIZE:
+                gray = cv2.resize(gray, (ORIENTATION_SIZE, ORIENTATION_SIZE), dst=small,
+                                  interpolation=cv2.INTER_AREA)
             
-            # Find contours
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            # Otsu picks the dark/light split per image; foreground pixels become 1
+            _, mask = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU,
+                                    dst=mask if gray.shape == mask.shape else None)
             
-            if not contours:
+            # Largest foreground blob and its centroid, from one labelling pass; label 0 is background.
+            # A 64x64 tile cannot hold more than 2^16 labels, so 16-bit labels halve the label image
+            count, _, stats, centroids = cv2.connectedComponentsWithStats(mask, connectivity=8, ltype=cv2.CV_16U)
+            if count < 2:
                 return "unknown"
-                
-            # Get the largest contour
-            largest_contour = max(contours, key=cv2.contourArea)
-            
-            # Get bounding box
-            rect = cv2.minAreaRect(largest_contour)
-            box = cv2.boxPoints(rect)
-            box = np.int0(box)
+            largest = 1 + stats[1:, cv2.CC_STAT_AREA].argmax()
+            cy = centroids[largest][1]
             
-            # Calculate center of mass
-            M = cv2.moments(largest_contour)
-            if M["m00"] != 0:
-                cx = int(M["m10"] / M["m00"])
-                cy = int(M["m01"] / M["m00"])
-            else:
-                return "unknown"
-                
-            # Analyze the distribution of pixels relative to center
-            height, width = img.shape[:2]
-            if cy < height/2:
+            # Mass above the middle means the shape is upright
+            if cy < gray.shape[0] / 2:
                 return "up"
             else:
                 return "down"
@@ -223,45 +313,29 @@ class LinkedInCaptcha:
             logger.error(f"Error detecting orientation: {str(e)}")
             return "unknown"
 
+    def _verification_state(self, driver):
+        """Return why verification looks finished, or False while it is still showing"""
+        normal_page, verifying = driver.execute_script(
+            VERIFICATION_STATE_JS, NORMAL_PAGE_XPATH, VERIFICATION_XPATH)
+        if normal_page:
+            return "back on normal LinkedIn page"
+        if not verifying:
+            return "no verification elements found"
+        return False
+
     def wait_for_verification_completion(self, timeout=300):  # 5 minutes timeout
         """Wait until the security verification is completed"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                # Check if we're back on a normal LinkedIn page
-                normal_page_indicators = [
-                    "//div[contains(@class, 'jobs-search-box')]",
-                    "//header[contains(@class, 'global-nav')]",
-                    "//div[contains(@class, 'jobs-search-results')]",
-                    "//div[contains(@class, 'jobs-search-two-pane')]"
-                ]
-                
-                for indicator in normal_page_indicators:
-                    if len(self.driver.find_elements(By.XPATH, indicator)) > 0:
-                        logger.info("Verification completed - back on normal LinkedIn page")
-                        time.sleep(2)  # Give a moment for page to fully load
-                        return True
-                
-                # Check if we're still on verification page
-                verification_indicators = [
-                    "//iframe",
-                    "//div[contains(text(), 'verification')]",
-                    "//div[contains(text(), 'security check')]",
-                    "//button[contains(text(), 'Verify')]"
-                ]
-                
-                if not any(len(self.driver.find_elements(By.XPATH, ind)) > 0 
-                          for ind in verification_indicators):
-                    logger.info("No verification elements found - assuming completed")
-                    time.sleep(2)
-                    return True
-                
-                logger.info("Still waiting for verification to complete...")
-                time.sleep(5)
-                
-            except Exception as e:
-                logger.error(f"Error while waiting for verification: {str(e)}")
-                time.sleep(5)
+        try:
+            # Transient script errors (e.g. mid-navigation) are retried on the next poll
+            reason = WebDriverWait(
+                self.driver, timeout,
+                poll_frequency=VERIFICATION_POLL_FREQUENCY,
+                ignored_exceptions=(WebDriverException,)
+            ).until(self._verification_state)
+        except TimeoutException:
+            logger.warning("Verification wait timeout reached")
+            return False
         
-        logger.warning("Verification wait timeout reached")
-        return False
+        logger.info(f"Verification completed - {reason}")
+        time.sleep(2)  # Give a moment for page to fully load
+        return True
@@ -0,0 +1,143 @@
+// Easy Apply form agent injected by LinkedInApply.
+// Python calls collectStep(modalSelector) once per form step, asks the AI for answers, then
+// hands them back to fillAndAdvance() so each step costs two WebDriver round-trips.
+(() => {
+    if (window.__lla) return;
+
+    const FIELD_SELECTOR = "input[type], select, textarea, div[role='textbox']";
+    const QUESTION_SELECTOR = 'div.jobs-easy-apply-form-section__grouping';
+    const STEP_BUTTON_SELECTOR = "button[aria-label*='Submit'], button[aria-label*='Next'], button[aria-label*='Review']";
+    // Inputs that are answered as screening questions or never need a value
+    const SKIPPED_TYPES = ['radio', 'checkbox', 'hidden', 'submit', 'button', 'file'];
+
+    // The Easy Apply modal collectStep last scoped to, so page inputs outside it are never filled
+    let root = document;
+    let fields = [];
+    let questions = [];
+
+    function fieldType(el) {
+        return el.tagName === 'SELECT' ? 'select' : (el.type || el.tagName.toLowerCase());
+    }
+
+    // label[for=id], then the enclosing form group's label, then aria-label, placeholder or name
+    function labelFor(el) {
+        const forLabel = el.id ? document.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null;
+        const groupLabel = el.closest("[class*='form-group'], [class*='form-element']")?.querySelector('label');
+        return ((forLabel || groupLabel)?.innerText || el.getAttribute('aria-label') ||
+                el.placeholder || el.name || '').trim();
+    }
+
+    // Option texts of a select in one pass; placeholders such as "Select an option" carry an empty value
+    function selectOptions(select) {
+        return select ? [...select.options].filter(o => o.value).map(o => o.text.trim()) : [];
+    }
+
+    // Sibling label, then label[for=id], then the radio's value
+    function radioLabel(radio) {
+        const next = radio.nextElementSibling;
+        const label = next && next.tagName === 'LABEL' ? next
+            : radio.id ? document.querySelector('label[for="' + CSS.escape(radio.id) + '"]') : null;
+        return (label ? label.innerText : radio.value).trim();
+    }
+
+    // Set a value the way typing would, so React-controlled inputs pick it up
+    function setValue(el, value) {
+        if (el.tagName === 'SELECT') {
+            // Match the visible text first, then the option value, ignoring case
+            const wanted = String(value).trim().toLowerCase();
+            const options = [...el.options];
+            let match = options.findIndex(o => o.text.trim().toLowerCase() === wanted);
+            if (match < 0) match = options.findIndex(o => o.value.toLowerCase() === wanted);
+            el.selectedIndex = match >= 0 ? match : 0;
+        } else if (el.isContentEditable || el.getAttribute('role') === 'textbox' && !('value' in el)) {
+            el.innerText = value;
+        } else {
+            const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        }
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+
+    // Step position from the modal's progress bar, or null if it has none
+    function stepProgress() {
+        const bar = root.querySelector("progress, [role='progressbar'][aria-valuenow]");
+        if (!bar) return null;
+        return bar.tagName === 'PROGRESS' ? bar.value : Number(bar.getAttribute('aria-valuenow'));
+    }
+
+    function collectStep(rootSelector) {
+        root = (rootSelector && document.querySelector(rootSelector)) || document;
+        // Fields filled on an earlier pass keep their mark and are not sent to the AI again;
+        // inputs inside a question grouping are answered as that question instead
+        fields = [...root.querySelectorAll(FIELD_SELECTOR)]
+            .filter(el => !SKIPPED_TYPES.includes(fieldType(el)) && !el.dataset.llaFilled &&
+                    !el.closest(QUESTION_SELECTOR));
+        questions = [...root.querySelectorAll(QUESTION_SELECTOR)]
+            .filter(q => !q.dataset.llaFilled)
+            .map(q => ({
+                el: q,
+                label: q.querySelector('label, span.jobs-easy-apply-form-element__label'),
+                input: q.querySelector("input[type='text'], textarea, select, input[type='radio']"),
+                radios: [...q.querySelectorAll("input[type='radio']")]
+            }));
+
+        return {
+            fields: fields.map((el, i) => ({
+                idx: i,
+                type: fieldType(el),
+                label: labelFor(el),
+                options: el.tagName === 'SELECT' ? selectOptions(el) : null
+            })),
+            progress: stepProgress(),
+            questions: questions.map((q, i) => {
+                const kind = !q.input ? null : q.radios.length ? 'radio' : fieldType(q.input) === 'select' ? 'select' : 'text';
+                const options = kind === 'radio' ? q.radios.map(radioLabel) : selectOptions(q.el.querySelector('select'));
+                return {
+                    idx: i,
+                    text: q.label ? q.label.innerText.trim() : '',
+                    kind: kind,
+                    options: options.length ? options : null
+                };
+            }).filter(q => q.text && q.kind)
+        };
+    }
+
+    function fillAndAdvance(answers) {
+        const filled = [];
+
+        for (const [idx, value] of Object.entries(answers.fields || {})) {
+            const el = fields[idx];
+            if (!el || !el.isConnected) continue;
+            setValue(el, String(value));
+            el.dataset.llaFilled = '1';
+            filled.push([labelFor(el), value]);
+        }
+
+        for (const [idx, answer] of Object.entries(answers.questions || {})) {
+            const q = questions[idx];
+            if (!q || !q.input || !q.el.isConnected) continue;
+            if (q.radios.length) {
+                const wanted = String(answer).trim().toLowerCase();
+                const radio = q.radios.find(r => radioLabel(r).toLowerCase() === wanted) ||
+                    q.radios.find(r => r.value.toLowerCase() === wanted);
+                if (!radio) continue;
+                radio.click();
+            } else {
+                setValue(q.input, answer);
+            }
+            q.el.dataset.llaFilled = '1';
+            filled.push([q.label.innerText.trim(), answer]);
+        }
+
+        const button = [...(root.isConnected ? root : document).querySelectorAll(STEP_BUTTON_SELECTOR)].find(b => !b.disabled);
+        if (!button) return {filled: filled, advanced: false};
+
+        // Only mutations caused by this click should count as a step change
+        window.__stepChanged = false;
+        button.click();
+        return {filled: filled, advanced: true};
+    }
+
+    window.__lla = {collectStep, fillAndAdvance};
+})();
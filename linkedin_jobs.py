@@ -1,5 +1,4 @@
 import logging
-import os
 import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
@@ -8,10 +7,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 from urllib.parse import quote
-import time
-import os
-from dotenv import load_dotenv
 
+from config import Config
 from utils.logger import setup_logger
 from utils.chrome_setup import ChromeSetup
 
@@ -24,11 +21,10 @@ class LinkedInJobs:
         self.driver = driver or ChromeSetup.initialize_driver()
         self.wait = WebDriverWait(self.driver, 10)  # Default 10 second wait
         
-        # Get search parameters from environment
-        load_dotenv('.env.local')
-        self.keywords = os.getenv("JOB_SEARCH_KEYWORDS")
-        self.location = os.getenv("JOB_SEARCH_LOCATION")
-        self.max_jobs = int(os.getenv("MAX_JOBS", "25"))
+        # Get search parameters from config
+        self.keywords = Config.JOB_SEARCH_KEYWORDS
+        self.location = Config.JOB_SEARCH_LOCATION
+        self.max_jobs = Config.MAX_JOBS
         
         if not self.keywords or not self.location:
             raise ValueError("Missing JOB_SEARCH_KEYWORDS or JOB_SEARCH_LOCATION in .env.local")
@@ -601,16 +597,21 @@ class LinkedInJobs:
         logger.warning("Could not fully verify search filters, but proceeding...")
         return False
 
+    def _first_text(self, root, selectors):
+        """Text of the first non-empty match for any selector, found with one CSS union query"""
+        for element in root.find_elements(By.CSS_SELECTOR, ", ".join(selectors)):
+            text = element.text.strip()
+            if text:
+                return text
+        return None
+
     def verify_page_loaded(self, verification_selectors, max_attempts=3, wait_time=3):
         """Verify if page elements are loaded correctly"""
         for attempt in range(max_attempts):
-            for selector in verification_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        return True
-                except:
-                    continue
+            # All selectors as one CSS union, checked in a single round-trip
+            elements = self.driver.find_elements(By.CSS_SELECTOR, ", ".join(verification_selectors))
+            if any(element.is_displayed() for element in elements):
+                return True
             
             # Always wait on failure, even on last attempt
             logger.warning(f"Page verification failed, attempt {attempt + 1}/{max_attempts}")
@@ -689,44 +690,20 @@ class LinkedInJobs:
                         ]
                         
                         # Try to find title
-                        title = None
-                        for selector in title_selectors:
-                            try:
-                                title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                title = title_elem.text.strip()
-                                if title:
-                                    break
-                            except:
-                                continue
+                        title = self._first_text(card, title_selectors)
                         
                         if not title:
                             logger.warning("Could not find job title, skipping...")
                             continue
                         
                         # Try to find company
-                        company = None
-                        for selector in company_selectors:
-                            try:
-                                company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                company = company_elem.text.strip()
-                                if company:
-                                    break
-                            except:
-                                continue
+                        company = self._first_text(card, company_selectors)
                         
                         if not company:
                             company = "Unknown Company"
                         
                         # Try to find location
-                        location = None
-                        for selector in location_selectors:
-                            try:
-                                location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                                location = location_elem.text.strip()
-                                if location:
-                                    break
-                            except:
-                                continue
+                        location = self._first_text(card, location_selectors)
                         
                         if not location:
                             location = "Unknown Location"
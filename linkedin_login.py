@@ -2,7 +2,7 @@ import logging
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
 import os
 
@@ -13,6 +13,9 @@ from utils.browser import check_browser_open
 # Set up logging
 logger = setup_logger(__name__, "linkedin_login")
 
+# Quick logged-in indicators (nav bar, search box, profile section), as one CSS union
+LOGGED_IN_CSS = "div.global-nav, input.search-global-typeahead__input, .feed-identity-module"
+
 class LinkedInLogin:
     def __init__(self, driver=None):
         """Initialize LinkedIn Login"""
@@ -135,22 +138,12 @@ class LinkedInLogin:
     def check_login_status(self):
         """Check if we are currently logged in"""
         try:
-            # Quick check for any of these elements
-            quick_indicators = [
-                "div.global-nav",  # Nav bar
-                "input.search-global-typeahead__input",  # Search box
-                ".feed-identity-module"  # Profile section
-            ]
-            
-            for selector in quick_indicators:
-                try:
-                    check_browser_open(self.driver)
-                    if self.driver.find_element(By.CSS_SELECTOR, selector):
-                        return True
-                except:
-                    continue
-            
-            return False
+            # Quick check for any of these elements in one query
+            try:
+                check_browser_open(self.driver)
+                return bool(self.driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_CSS))
+            except (WebDriverException, TimeoutException):
+                return False
             
         except Exception as e:
             logger.error(f"Error checking login status: {str(e)}")
@@ -1,17 +1,22 @@
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
+from openai import OpenAI, AsyncOpenAI
+from config import Config
 
-# Load environment variables
-load_dotenv('.env.local')
-
-# Get API key from environment
-api_key = os.getenv('AIML_API_KEY')
+# Get API key from config (environment is loaded once in config.py)
+api_key = Config.AIML_API_KEY
 if not api_key:
     raise ValueError("AIML_API_KEY not found in environment")
 
-# Initialize OpenAI client with AIML API
+# Initialize OpenAI client with AIML API. Clients are module-level so every
+# caller shares one keep-alive connection pool.
 api = OpenAI(
     api_key=api_key,
-    base_url="https://api.aimlapi.com/v1"
+    base_url="https://api.aimlapi.com/v1",
+    timeout=30
+)
+
+# Async client sharing the same configuration, for concurrent requests
+async_api = AsyncOpenAI(
+    api_key=api_key,
+    base_url="https://api.aimlapi.com/v1",
+    timeout=30
 )
\ No newline at end of file
@@ -1,9 +1,21 @@
 import sys
+import atexit
+import queue
+import threading
 from selenium.common.exceptions import WebDriverException
+from config import Config
+from utils.chrome_setup import ChromeSetup
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__, "browser")
 
+# Drivers kept alive across jobs, and how many jobs one driver serves before it is recycled
+POOL_SIZE = 4
+MAX_USES_PER_INSTANCE = 50
+
+# Page on the LinkedIn domain to load shared cookies from; add_cookie only sets cookies for the current domain
+LINKEDIN_HOME_URL = "https://www.linkedin.com"
+
 def check_browser_open(driver):
     """Check if browser is still open"""
     try:
@@ -27,3 +39,140 @@ def cleanup_driver(driver):
             driver.quit()
         except:
             pass
+
+class BrowserPool:
+    def __init__(self, size=POOL_SIZE, max_uses=MAX_USES_PER_INSTANCE, headless=None):
+        """Initialize a pool of reusable Chrome drivers, started on demand"""
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = Config.BROWSER_HEADLESS if headless is None else headless
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        # Session cookies of a logged-in browser, and the pooled drivers that already carry them
+        self._cookies = None
+        self._logged_in = set()
+
+    @property
+    def has_login(self):
+        """Whether a LinkedIn session has been shared with the pool"""
+        return self._cookies is not None
+
+    def set_login_cookies(self, cookies, source=None):
+        """Share a logged-in session with every pooled driver, loaded on its next acquire"""
+        with self._lock:
+            self._cookies = list(cookies)
+            # The driver the cookies came from is already logged in
+            self._logged_in = {source} if source is not None else set()
+
+    def _load_login(self, driver):
+        """Load the shared session cookies into a driver that does not have them yet"""
+        with self._lock:
+            cookies = self._cookies
+            if cookies is None or driver in self._logged_in:
+                return
+        
+        driver.get(LINKEDIN_HOME_URL)
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException as e:
+                logger.debug(f"Could not set cookie {cookie.get('name')}: {str(e)}")
+        with self._lock:
+            self._logged_in.add(driver)
+
+    def _create_driver(self):
+        """Start a new Chrome driver for the pool"""
+        driver = ChromeSetup().initialize_driver(headless=self.headless, block_images=True)
+        if driver is None:
+            with self._lock:
+                self._created -= 1
+            raise WebDriverException("Failed to start Chrome for browser pool")
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def warm(self, count=None):
+        """Start drivers ahead of time so the first jobs skip browser startup"""
+        for _ in range(min(count or self.size, self.size)):
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            self._idle.put(self._create_driver())
+
+    def acquire(self, timeout=None):
+        """Take an idle driver, starting one if the pool is not full yet, logged in if a session is shared"""
+        driver = self._take(timeout)
+        try:
+            self._load_login(driver)
+        except WebDriverException:
+            self._discard(driver)
+            raise
+        return driver
+
+    def _take(self, timeout=None):
+        """Take an idle driver, or start one if the pool is not full yet"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            return self._create_driver()
+        return self._idle.get(timeout=timeout)
+
+    def release(self, driver):
+        """Return a driver to the pool, recycling it once it has served max_uses jobs"""
+        if driver is None:
+            return
+        # Several workers release at once, so the count is read and bumped under the lock
+        with self._lock:
+            closed = driver not in self._uses
+            if not closed:
+                uses = self._uses[driver] = self._uses[driver] + 1
+        if closed:
+            # close_all already quit this driver while it was checked out
+            cleanup_driver(driver)
+            return
+        
+        try:
+            if uses >= self.max_uses:
+                raise WebDriverException("Driver reached its use limit")
+            # Park on a blank page so the previous job's page stops running scripts;
+            # the browser keeps its cookies, so a shared login survives
+            driver.get('about:blank')
+            self._idle.put(driver)
+        except WebDriverException as e:
+            logger.info(f"Recycling browser: {str(e)}")
+            self._discard(driver)
+
+    def _discard(self, driver):
+        """Quit a driver and free its slot in the pool"""
+        cleanup_driver(driver)
+        with self._lock:
+            self._logged_in.discard(driver)
+            # close_all may have freed the slot already
+            if self._uses.pop(driver, None) is not None:
+                self._created -= 1
+
+    def close_all(self):
+        """Quit every driver the pool started, idle or checked out"""
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers = list(self._uses)
+        for driver in drivers:
+            self._discard(driver)
+
+# Shared pool for LinkedInApply instances, closed at exit so no Chrome process outlives the run
+browser_pool = BrowserPool()
+atexit.register(browser_pool.close_all)
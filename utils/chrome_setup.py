@@ -1,7 +1,5 @@
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 import platform
 import subprocess
 
@@ -23,7 +21,7 @@ class ChromeSetup:
             logger.warning(f"Could not get Chrome version: {str(e)}")
             return None
 
-    def initialize_driver(self, headless=False):
+    def initialize_driver(self, headless=False, block_images=False):
         """Initialize Chrome WebDriver with options"""
         try:
             chrome_options = Options()
@@ -38,8 +36,21 @@ class ChromeSetup:
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--disable-notifications')
             chrome_options.add_argument('--start-maximized')
+            # Nothing the bot does needs extensions, default apps or background sync at startup
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-default-apps')
+            chrome_options.add_argument('--disable-background-networking')
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
             
+            # Return from driver.get at DOMContentLoaded; explicit waits cover the rest
+            chrome_options.page_load_strategy = 'eager'
+            
+            # Skip image downloads for flows that only need the DOM (not login/CAPTCHA)
+            if block_images:
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2
+                })
+            
             # Initialize driver with options using Selenium Manager
             driver = webdriver.Chrome(options=chrome_options)
             
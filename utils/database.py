@@ -1,17 +1,163 @@
 import sqlite3
 import os
-from datetime import datetime
+import json
+import queue
+import time
+import atexit
+import threading
+from itertools import groupby
+from contextlib import contextmanager
 from utils.logger import setup_logger
 
 # Set up logging
 logger = setup_logger(__name__, "database")
 
+# Queued writes are flushed by the background writer once this many are pending...
+WRITE_BATCH_SIZE = 50
+# ...or at least this often, in seconds
+WRITE_FLUSH_INTERVAL = 2
+
+# Prepared statements kept by the shared connection
+STATEMENT_CACHE_SIZE = 256
+
+# Schema version kept in PRAGMA user_version; version 1 stores timestamps as INTEGER epoch seconds
+SCHEMA_VERSION = 1
+
+# Timestamp columns written as datetime text before version 1, as (table, column)
+TIMESTAMP_COLUMNS = [
+    ('jobs', 'date_applied'),
+    ('job_analysis', 'analyzed_at'),
+    ('role_analysis', 'analyzed_at'),
+    ('application_attempts', 'attempt_date'),
+    ('application_log', 'logged_at')
+]
+
+# Write statements, defined once so every call reuses the same cached statement
+# Jobs are inserted once and updated in place afterwards; REPLACE would delete and
+# re-insert the row, rewriting every index entry and giving it a new id
+SQL_INSERT_JOB = '''
+    INSERT OR IGNORE INTO jobs 
+    (job_id, title, company, location, date_applied, application_status, job_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_UPDATE_JOB = '''
+    UPDATE jobs SET
+        title = COALESCE(?, title),
+        company = COALESCE(?, company),
+        location = COALESCE(?, location),
+        date_applied = ?,
+        application_status = ?,
+        job_url = COALESCE(?, job_url)
+    WHERE job_id = ?
+'''
+SQL_INSERT_JOB_DETAILS = '''
+    INSERT OR IGNORE INTO job_details (job_id, description, salary_range) VALUES (?, ?, ?)
+'''
+SQL_UPDATE_JOB_DETAILS = '''
+    UPDATE job_details SET
+        description = COALESCE(?, description),
+        salary_range = COALESCE(?, salary_range)
+    WHERE job_id = ?
+'''
+SQL_INSERT_FORM_FIELD = '''
+    INSERT INTO form_fields (job_id, field_type, field_label, field_options, is_required)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_SAVE_ANALYSIS = '''
+    INSERT OR REPLACE INTO job_analysis (job_id, should_apply, reason, analyzed_at)
+    VALUES (?, ?, ?, ?)
+'''
+SQL_SAVE_ROLE_ANALYSIS = '''
+    INSERT OR REPLACE INTO role_analysis (company, title, should_apply, reason, analyzed_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_INSERT_APPLICATION_ATTEMPT = '''
+    INSERT INTO application_attempts (job_id, attempt_date, status, error_message, step_reached, form_data)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+SQL_INSERT_APPLICATION_LOG = '''
+    INSERT INTO application_log (job_id, status, job_data, error, logged_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
 class DatabaseManager:
     def __init__(self, db_path="jobs.db"):
         """Initialize DatabaseManager with database path"""
         self.db_path = db_path
+        # (sql, params) pairs written in order by the background writer
+        self._write_queue = queue.Queue()
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+        self._conn = None
+        self._conn_lock = threading.RLock()
+        # Open transaction() blocks; while non-zero, writes wait for the block's commit
+        self._batch_depth = 0
         self.setup_database()
     
+    @contextmanager
+    def _connect(self):
+        """Borrow the shared connection, committing on success and rolling back on error"""
+        with self._conn_lock:
+            if self._conn is None:
+                # One long-lived connection keeps its prepared statements between calls
+                self._conn = sqlite3.connect(
+                    self.db_path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+                # WAL only needs an fsync at checkpoints, so NORMAL is still crash-safe
+                self._conn.execute('PRAGMA synchronous=NORMAL')
+                self._conn.execute('PRAGMA temp_store=MEMORY')
+                self._conn.execute('PRAGMA cache_size=-20000')
+            if self._batch_depth:
+                yield self._conn
+            else:
+                with self._conn:
+                    yield self._conn
+    
+    @contextmanager
+    def transaction(self):
+        """Group every write made inside the block into one commit, rolled back if the block raises"""
+        with self._flush_lock, self._conn_lock:
+            # Writes queued before the block are committed on their own, so a rollback cannot take them
+            if not self._batch_depth:
+                self._write_queued()
+            self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._end_batch(commit=False)
+            raise
+        else:
+            self._end_batch(commit=True)
+    
+    def _end_batch(self, commit):
+        """Leave a transaction() block, finishing the transaction when the outermost one ends"""
+        with self._flush_lock, self._conn_lock:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._conn is not None:
+                if commit:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+                # Writes queued during the block were held back; they get their own commit now
+                self._write_queued()
+    
+    def commit(self):
+        """Commit writes made so far, including those inside an open transaction() block"""
+        with self._flush_lock, self._conn_lock:
+            if self._conn is not None:
+                self._conn.commit()
+            # The transaction is empty now, so queued writes can be committed on their own
+            self._write_queued()
+    
+    def close(self):
+        """Flush queued writes and close the shared connection"""
+        self.flush_writes()
+        with self._conn_lock:
+            if self._conn is not None:
+                # Refresh planner statistics (ANALYZE) for tables that grew during the run
+                self._conn.execute('PRAGMA optimize')
+                self._conn.close()
+                self._conn = None
+    
     def setup_database(self):
         """Setup SQLite database and create necessary tables"""
         try:
@@ -21,7 +167,9 @@ class DatabaseManager:
                 os.makedirs(db_dir)
             
             # Connect to database and create tables
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                # WAL persists in the database file, so it is set once here
+                conn.execute('PRAGMA journal_mode=WAL')
                 cursor = conn.cursor()
                 
                 # Create jobs table
@@ -32,7 +180,7 @@ class DatabaseManager:
                         title TEXT,
                         company TEXT,
                         location TEXT,
-                        date_applied TIMESTAMP,
+                        date_applied INTEGER,
                         application_status TEXT,
                         job_url TEXT,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -67,42 +215,153 @@ class DatabaseManager:
                     )
                 ''')
                 
-                conn.commit()
+                # Create job_analysis table for cached AI apply decisions
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS job_analysis (
+                        job_id TEXT PRIMARY KEY,
+                        should_apply INTEGER,
+                        reason TEXT,
+                        analyzed_at INTEGER
+                    )
+                ''')
+                
+                # Create role_analysis table so re-posts of the same role reuse a decision
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS role_analysis (
+                        company TEXT,
+                        title TEXT,
+                        should_apply INTEGER,
+                        reason TEXT,
+                        analyzed_at INTEGER,
+                        PRIMARY KEY (company, title)
+                    )
+                ''')
+                
+                # Create form_fields table for the fields seen on application forms
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS form_fields (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job_id TEXT,
+                        field_type TEXT,
+                        field_label TEXT,
+                        field_options TEXT,
+                        is_required BOOLEAN,
+                        FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+                    )
+                ''')
+                
+                # Create application_attempts table for each run through an application form
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS application_attempts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job_id TEXT,
+                        attempt_date INTEGER,
+                        status TEXT,
+                        error_message TEXT,
+                        step_reached TEXT,
+                        form_data TEXT,
+                        FOREIGN KEY (job_id) REFERENCES jobs(job_id)
+                    )
+                ''')
+                
+                # Create application_log table for per-attempt outcomes
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS application_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job_id TEXT,
+                        status TEXT,
+                        job_data TEXT,
+                        error TEXT,
+                        logged_at INTEGER
+                    )
+                ''')
+                
+                # One composite index serves status lookups and date-ordered status scans.
+                # It is keyed on UPPER() because statuses are stored as 'applied' and 'APPLIED'
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_jobs_status_date
+                    ON jobs(UPPER(application_status), date_applied DESC, job_id)
+                ''')
+                
+                self._migrate(conn)
                 logger.info("Database setup completed successfully")
                 
         except Exception as e:
             logger.error(f"Error setting up database: {str(e)}")
             raise
     
+    def _migrate(self, conn):
+        """Bring a database created by an older version up to SCHEMA_VERSION"""
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        if version < 1:
+            # Old rows hold local-time datetime text, which sorts above every integer;
+            # the 'utc' modifier converts them from local time to epoch seconds
+            for table, column in TIMESTAMP_COLUMNS:
+                converted = conn.execute(f'''
+                    UPDATE {table} SET {column} = CAST(strftime('%s', {column}, 'utc') AS INTEGER)
+                    WHERE typeof({column}) = 'text' AND strftime('%s', {column}, 'utc') IS NOT NULL
+                ''').rowcount
+                if converted:
+                    logger.info(f"Converted {converted} {table}.{column} timestamps to epoch seconds")
+        if version < SCHEMA_VERSION:
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    
     def add_job(self, job_data):
-        """Add a job to the database"""
+        """Add a job to the database, or update it in place if it is already there"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT OR REPLACE INTO jobs 
-                    (job_id, title, company, location, date_applied, application_status, job_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            with self._connect() as conn:
+                self._upsert_job(
+                    conn,
                     job_data.get('job_id'),
                     job_data.get('title'),
                     job_data.get('company'),
                     job_data.get('location'),
-                    datetime.now(),
                     job_data.get('status', 'applied'),
                     job_data.get('url')
-                ))
-                conn.commit()
+                )
                 logger.info(f"Added job: {job_data.get('title')} at {job_data.get('company')}")
                 return True
         except Exception as e:
             logger.error(f"Error adding job to database: {str(e)}")
             return False
     
+    def _upsert_job(self, conn, job_id, title, company, location, status, job_url):
+        """Insert a job row on first sight, otherwise update its status and any known fields"""
+        now = int(time.time())
+        cursor = conn.cursor()
+        cursor.execute(SQL_INSERT_JOB, (job_id, title, company, location, now, status, job_url))
+        if cursor.rowcount == 0:
+            cursor.execute(SQL_UPDATE_JOB, (title, company, location, now, status, job_url, job_id))
+    
+    def save_job_details(self, job_id, company_name, job_title, description, location, salary_range,
+                         job_url, num_applicants, is_remote, status, failure_reason=None):
+        """Queue a job and its details pane for the background writer, updating existing rows in place"""
+        now = int(time.time())
+        # The UPDATE after INSERT OR IGNORE is a no-op rewrite for new rows, so no read is needed
+        self._queue_write(SQL_INSERT_JOB, (job_id, job_title, company_name, location, now, status, job_url))
+        self._queue_write(SQL_UPDATE_JOB, (job_title, company_name, location, now, status, job_url, job_id))
+        self._queue_write(SQL_INSERT_JOB_DETAILS, (job_id, description, salary_range))
+        self._queue_write(SQL_UPDATE_JOB_DETAILS, (description, salary_range, job_id))
+        if failure_reason:
+            self.log_application(job_id, status, error=failure_reason)
+        return True
+    
+    def log_application_attempt(self, job_id, status, error_message=None, step_reached=None, form_data=None):
+        """Queue an application attempt for the background writer"""
+        self._queue_write(SQL_INSERT_APPLICATION_ATTEMPT, (
+            job_id,
+            int(time.time()),
+            status,
+            error_message,
+            step_reached,
+            json.dumps(form_data, default=str) if form_data is not None else None
+        ))
+        return True
+    
     def job_exists(self, job_id):
         """Check if a job already exists in the database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT COUNT(*) FROM jobs WHERE job_id = ?', (job_id,))
                 count = cursor.fetchone()[0]
@@ -111,13 +370,182 @@ class DatabaseManager:
             logger.error(f"Error checking job existence: {str(e)}")
             return False
     
+    def save_form_fields(self, fields):
+        """Save (job_id, field_type, field_label, field_options, is_required) rows in one transaction"""
+        if not fields:
+            return True
+        try:
+            with self._connect() as conn:
+                conn.executemany(SQL_INSERT_FORM_FIELD, [
+                    (job_id, field_type, field_label,
+                     json.dumps(field_options) if field_options is not None else None, bool(is_required))
+                    for job_id, field_type, field_label, field_options, is_required in fields
+                ])
+                return True
+        except Exception as e:
+            logger.error(f"Error saving form fields: {str(e)}")
+            return False
+    
+    def has_seen(self, job_id):
+        """Check whether a job was already recorded, using the unique job_id index"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT 1 FROM jobs WHERE job_id = ? LIMIT 1', (job_id,))
+                return cursor.fetchone() is not None
+        except Exception as e:
+            logger.error(f"Error checking seen job: {str(e)}")
+            return False
+    
     def get_applied_jobs(self):
-        """Get all applied jobs from the database"""
+        """Get all applied jobs from the database, newest first"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM jobs ORDER BY date_applied DESC')
+                # Filtering on the indexed UPPER(application_status) lets idx_jobs_status_date
+                # return the rows already in date order instead of sorting the whole table
+                cursor.execute('''
+                    SELECT * FROM jobs WHERE UPPER(application_status) = 'APPLIED'
+                    ORDER BY date_applied DESC
+                ''')
                 return cursor.fetchall()
         except Exception as e:
             logger.error(f"Error getting applied jobs: {str(e)}")
             return []
+    
+    def get_applied_job_ids(self):
+        """Get the IDs of all applied jobs as a set, for in-memory membership checks"""
+        try:
+            with self._connect() as conn:
+                # Build the set straight from the cursor, without a fetchall() list in between
+                return {job_id for (job_id,) in conn.execute(
+                    "SELECT job_id FROM jobs WHERE UPPER(application_status) = 'APPLIED'"
+                )}
+        except Exception as e:
+            logger.error(f"Error getting applied job IDs: {str(e)}")
+            return set()
+    
+    def get_analysis(self, job_id):
+        """Get the saved AI analysis for a job, or None if it was never analyzed"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT should_apply, reason, analyzed_at FROM job_analysis WHERE job_id = ?',
+                    (job_id,)
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return {
+                    'should_apply': bool(row[0]),
+                    'reason': row[1],
+                    'analyzed_at': row[2]
+                }
+        except Exception as e:
+            logger.error(f"Error getting job analysis: {str(e)}")
+            return None
+    
+    def get_role_analysis(self, company, title):
+        """Get the saved AI analysis for a company and title, or None if never analyzed"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT should_apply, reason, analyzed_at FROM role_analysis WHERE company = ? AND title = ?',
+                    (company, title)
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return {
+                    'should_apply': bool(row[0]),
+                    'reason': row[1],
+                    'analyzed_at': row[2]
+                }
+        except Exception as e:
+            logger.error(f"Error getting role analysis: {str(e)}")
+            return None
+    
+    def save_analysis(self, job_id, should_apply, reason, analyzed_at=None, company=None, title=None):
+        """Save the AI analysis for a job, and for its role when given, so it is not repeated"""
+        try:
+            analyzed_at = analyzed_at or int(time.time())
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute(SQL_SAVE_ANALYSIS, (job_id, int(bool(should_apply)), reason, analyzed_at))
+                if company and title:
+                    cursor.execute(SQL_SAVE_ROLE_ANALYSIS,
+                                   (company, title, int(bool(should_apply)), reason, analyzed_at))
+                return True
+        except Exception as e:
+            logger.error(f"Error saving job analysis: {str(e)}")
+            return False
+    
+    def log_application(self, job_id, status, job_data=None, error=None):
+        """Queue an application outcome for the background writer"""
+        self._queue_write(SQL_INSERT_APPLICATION_LOG, (
+            job_id,
+            status,
+            json.dumps(job_data, default=str) if job_data is not None else None,
+            error,
+            int(time.time())
+        ))
+    
+    def _queue_write(self, sql, params):
+        """Queue one write; the caller never waits on SQLite unless a full batch is pending"""
+        self._write_queue.put((sql, params))
+        if self._flusher is None:
+            self._start_flusher()
+        if self._write_queue.qsize() >= WRITE_BATCH_SIZE:
+            self.flush_writes()
+    
+    def _start_flusher(self):
+        """Start the background writer thread and close the database, flushing what is left, at exit"""
+        with self._flush_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+        atexit.register(self.close)
+    
+    def _flush_periodically(self):
+        """Flush queued writes every WRITE_FLUSH_INTERVAL seconds"""
+        while True:
+            time.sleep(WRITE_FLUSH_INTERVAL)
+            self.flush_writes()
+    
+    def flush_writes(self):
+        """Write everything queued in one transaction, in queue order"""
+        with self._flush_lock, self._conn_lock:
+            # Inside a transaction() block the writes would be lost to its rollback, so they
+            # stay queued until the block commits or rolls back
+            if self._batch_depth:
+                return 0
+            return self._write_queued()
+    
+    def _write_queued(self):
+        """Write and commit the queued records on their own; callers hold both locks"""
+        writes = []
+        while True:
+            try:
+                writes.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not writes:
+            return 0
+        
+        try:
+            with self._connect() as conn:
+                try:
+                    # Consecutive writes of the same statement go through one executemany
+                    for sql, group in groupby(writes, key=lambda write: write[0]):
+                        conn.executemany(sql, [params for _, params in group])
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+            return len(writes)
+        except Exception as e:
+            logger.error(f"Error writing queued records: {str(e)}")
+            return 0
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from utils.logger import setup_logger
+
+# Set up logging
+logger = setup_logger(__name__, "llm_cache")
+
+class LLMCache:
+    def __init__(self, db_path=".cache/llm.db", maxsize=1024, expire=7 * 86400):
+        """Initialize two-tier (memory + disk) cache for LLM responses"""
+        self.db_path = db_path
+        self.maxsize = maxsize
+        self.expire = expire
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.setup_database()
+
+    def setup_database(self):
+        """Create the on-disk cache table"""
+        try:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir)
+
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key TEXT PRIMARY KEY,
+                        response TEXT,
+                        created_at REAL
+                    )
+                ''')
+        except Exception as e:
+            logger.error(f"Error setting up LLM cache: {str(e)}")
+
+    @staticmethod
+    def make_key(request):
+        """Build a stable key from the request arguments"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Look up a cached response, memory first then disk"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    'SELECT response, created_at FROM llm_cache WHERE key = ?', (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.warning(f"Error reading LLM cache: {str(e)}")
+            row = None
+
+        with self._lock:
+            if row and time.time() - row[1] < self.expire:
+                self._remember(key, row[0])
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key, response):
+        """Store a response in both tiers"""
+        with self._lock:
+            self._remember(key, response)
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)',
+                    (key, response, time.time())
+                )
+        except Exception as e:
+            logger.warning(f"Error writing LLM cache: {str(e)}")
+
+    def _remember(self, key, response):
+        """Insert into the in-memory LRU, evicting the oldest entry if full"""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        """Return cache hit/miss counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._memory)
+        }